@@ -14,13 +14,23 @@ import logging
 import atexit
 import re
 import os
+import sys
 import uuid
+import socket
 from werkzeug.utils import secure_filename
 import requests
 import firebase_admin
 from firebase_admin import credentials, auth
 import pytz
 import shutil
+from contextlib import contextmanager
+import unicodedata
+import hashlib
+from collections import namedtuple, OrderedDict
+from types import MappingProxyType, SimpleNamespace
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -29,20 +39,375 @@ logger = logging.getLogger(__name__)
 # Initialize scheduler variable
 scheduler = None
 
-# Set up request caching
-requests_cache.install_cache('mlb_api_cache', backend='sqlite', expire_after=3600)  # Cache for 1 hour
+# Upstream HTTP settings
+MLB_API_BASE_URL = os.environ.get('MLB_API_BASE_URL')  # Replaces https://statsapi.mlb.com/api/, e.g. to use mlb_stub_server.py
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 20))  # Keep-alive connections per upstream host
+HTTP_DEFAULT_TIMEOUT = float(os.environ.get('HTTP_DEFAULT_TIMEOUT', 15))  # Seconds, for calls that don't set one
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 3))  # Retries on connection errors, 429 and 5xx
+
+def build_http_session(cached=True):
+    """
+    Build a pooled keep-alive session for upstream calls.
+    
+    Connections are reused per host (at most HTTP_POOL_MAXSIZE each), and
+    idempotent requests are retried with jittered exponential backoff.
+    Cached sessions store responses in mlb_api_cache.sqlite for 1 hour.
+    """
+    if cached:
+        session = requests_cache.CachedSession('mlb_api_cache', backend='sqlite', expire_after=3600)  # Cache for 1 hour
+    else:
+        session = requests.Session()
+    
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=True, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Shared sessions: MLB Stats API responses are cached; the odds feed keeps its own snapshot
+HTTP_SESSION = build_http_session(cached=True)
+ODDS_HTTP_SESSION = build_http_session(cached=False)
+
+# Process-wide upstream request counters
+UPSTREAM_CALL_STATS = {
+    'requests': 0,
+    'cache_hits': 0,
+    'errors': 0
+}
+UPSTREAM_CALL_STATS_LOCK = threading.Lock()
+
+# Upstream rate governor settings (MLB Stats API only)
+UPSTREAM_INTERACTIVE_RATE = float(os.environ.get('UPSTREAM_INTERACTIVE_RATE', 10))  # Max requests/second for user-facing requests
+UPSTREAM_BACKGROUND_RATE = float(os.environ.get('UPSTREAM_BACKGROUND_RATE', 4))  # Max requests/second for scheduled jobs
+UPSTREAM_MIN_RATE = 0.5  # Floor the adaptive rate never drops below
+UPSTREAM_RATE_STEP = 0.25  # Requests/second recovered after each healthy response
+UPSTREAM_SLOW_RESPONSE = float(os.environ.get('UPSTREAM_SLOW_RESPONSE', 2.0))  # Seconds before a response counts as slow
+
+# Token buckets per priority; interactive calls never spend the background budget
+UPSTREAM_BUDGETS = {
+    priority: {
+        'max_rate': max_rate,
+        'rate': max_rate,
+        'tokens': max_rate * 2,
+        'burst': max_rate * 2,
+        'updated': time.monotonic(),
+        'paused_until': 0.0,
+        'throttled': 0,
+        'waited_seconds': 0.0
+    }
+    for priority, max_rate in (('interactive', UPSTREAM_INTERACTIVE_RATE), ('background', UPSTREAM_BACKGROUND_RATE))
+}
+UPSTREAM_GOVERNOR_LOCK = threading.Lock()
+
+# Priority of upstream calls made by the current thread
+UPSTREAM_PRIORITY = threading.local()
+
+def get_upstream_priority():
+    return getattr(UPSTREAM_PRIORITY, 'value', 'interactive')
+
+@contextmanager
+def upstream_priority(priority):
+    """Run the enclosed upstream calls against the given budget ('interactive' or 'background')"""
+    previous = get_upstream_priority()
+    UPSTREAM_PRIORITY.value = priority
+    try:
+        yield
+    finally:
+        UPSTREAM_PRIORITY.value = previous
+
+def background_job(f):
+    """Decorator for scheduled jobs so their upstream calls use the background budget"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        with upstream_priority('background'):
+            return f(*args, **kwargs)
+    return decorated_function
+
+def acquire_upstream_token(priority, timeout):
+    """
+    Wait for a token from the priority's bucket.
+    
+    Raises TimeoutError if no token frees up within timeout seconds, so a
+    throttled upstream fails fast instead of piling up waiting threads.
+    """
+    deadline = time.monotonic() + timeout
+    waited = 0.0
+    while True:
+        with UPSTREAM_GOVERNOR_LOCK:
+            budget = UPSTREAM_BUDGETS[priority]
+            now = time.monotonic()
+            budget['tokens'] = min(budget['burst'], budget['tokens'] + (now - budget['updated']) * budget['rate'])
+            budget['updated'] = now
+            
+            if now < budget['paused_until']:
+                wait = budget['paused_until'] - now
+            elif budget['tokens'] >= 1:
+                budget['tokens'] -= 1
+                budget['waited_seconds'] += waited
+                return
+            else:
+                wait = (1 - budget['tokens']) / budget['rate']
+        
+        if now + wait > deadline:
+            raise TimeoutError(f"Upstream {priority} rate budget exhausted after {timeout} seconds")
+        time.sleep(wait)
+        waited += wait
+
+def refund_upstream_token(priority):
+    """Return a token for a request that was answered from the response cache"""
+    with UPSTREAM_GOVERNOR_LOCK:
+        budget = UPSTREAM_BUDGETS[priority]
+        budget['tokens'] = min(budget['burst'], budget['tokens'] + 1)
+
+def record_upstream_result(priority, status_code, elapsed, retry_after=None):
+    """
+    Adapt the budgets to how the upstream is coping (AIMD).
+    
+    429/5xx responses and connection errors (status_code None) halve both
+    budgets and honour Retry-After. Slow responses halve only the background
+    budget so batch work backs off first. Healthy responses let the caller's
+    budget recover gradually towards its configured maximum.
+    """
+    throttled = status_code is None or status_code == 429 or status_code >= 500
+    slow = elapsed > UPSTREAM_SLOW_RESPONSE
+    
+    with UPSTREAM_GOVERNOR_LOCK:
+        if throttled:
+            for name, budget in UPSTREAM_BUDGETS.items():
+                budget['rate'] = max(UPSTREAM_MIN_RATE, budget['rate'] / 2)
+                budget['tokens'] = min(budget['tokens'], 1)
+                if retry_after:
+                    budget['paused_until'] = max(budget['paused_until'], time.monotonic() + retry_after)
+            UPSTREAM_BUDGETS[priority]['throttled'] += 1
+            logger.warning(f"Upstream throttling (status {status_code}), rates now "
+                           f"{UPSTREAM_BUDGETS['interactive']['rate']:.2f}/{UPSTREAM_BUDGETS['background']['rate']:.2f} req/s")
+        elif slow:
+            budget = UPSTREAM_BUDGETS['background']
+            budget['rate'] = max(UPSTREAM_MIN_RATE, budget['rate'] / 2)
+        else:
+            budget = UPSTREAM_BUDGETS[priority]
+            budget['rate'] = min(budget['max_rate'], budget['rate'] + UPSTREAM_RATE_STEP)
+
+def get_upstream_governor_status():
+    """Current rate, token and throttle counts for each budget"""
+    with UPSTREAM_GOVERNOR_LOCK:
+        return {
+            priority: {
+                'rate': round(budget['rate'], 2),
+                'max_rate': budget['max_rate'],
+                'tokens': round(budget['tokens'], 2),
+                'paused': budget['paused_until'] > time.monotonic(),
+                'throttled': budget['throttled'],
+                'waited_seconds': round(budget['waited_seconds'], 2)
+            }
+            for priority, budget in UPSTREAM_BUDGETS.items()
+        }
+
+def parse_retry_after(response):
+    """Seconds from a Retry-After header, if the upstream sent one in delta-seconds form"""
+    try:
+        return min(float(response.headers.get('Retry-After')), 60)
+    except (TypeError, ValueError):
+        return None
+
+def http_get(url, session=None, timeout=None, **kwargs):
+    """
+    GET through a pooled upstream session with a default timeout.
+    
+    Calls on the MLB Stats API session go through the rate governor, using
+    the budget of the calling thread's priority. In cassette record mode
+    successful responses are also written to the fixture store; in replay
+    mode they are served from it and nothing goes upstream.
+    """
+    if CASSETTE_MODE == 'replay':
+        # Nothing goes upstream, so there is nothing for the governor to protect
+        with UPSTREAM_CALL_STATS_LOCK:
+            UPSTREAM_CALL_STATS['requests'] += 1
+        return replay_cassette_response(url, kwargs.get('params'))
+    
+    session = session or HTTP_SESSION
+    timeout = timeout or HTTP_DEFAULT_TIMEOUT
+    governed = session is HTTP_SESSION
+    priority = get_upstream_priority()
+    
+    if governed:
+        acquire_upstream_token(priority, timeout)
+    
+    # Cassettes stay keyed by the real upstream URL; only the request goes elsewhere
+    request_url = url
+    if MLB_API_BASE_URL and url.startswith(statsapi.BASE_URL):
+        request_url = MLB_API_BASE_URL.rstrip('/') + '/' + url[len(statsapi.BASE_URL):]
+    
+    start_time = time.monotonic()
+    try:
+        response = session.get(request_url, timeout=timeout, **kwargs)
+    except Exception:
+        if governed:
+            record_upstream_result(priority, None, time.monotonic() - start_time)
+        with UPSTREAM_CALL_STATS_LOCK:
+            UPSTREAM_CALL_STATS['requests'] += 1
+            UPSTREAM_CALL_STATS['errors'] += 1
+        raise
+    
+    from_cache = getattr(response, 'from_cache', False)
+    if governed:
+        if from_cache:
+            refund_upstream_token(priority)
+        else:
+            record_upstream_result(priority, response.status_code, time.monotonic() - start_time, parse_retry_after(response))
+    
+    if CASSETTE_MODE == 'record' and response.status_code == 200:
+        record_cassette_response(url, kwargs.get('params'), response)
+    
+    with UPSTREAM_CALL_STATS_LOCK:
+        UPSTREAM_CALL_STATS['requests'] += 1
+        if from_cache:
+            UPSTREAM_CALL_STATS['cache_hits'] += 1
+    return response
+
+# Record/replay settings for offline benchmarking
+CASSETTE_MODE = os.environ.get('MLB_CASSETTE_MODE', 'off').lower()  # 'off', 'record' or 'replay'
+CASSETTE_DIR = os.environ.get('MLB_CASSETTE_DIR', 'cassettes')  # Root of the fixture store
+CASSETTE_NAME = os.environ.get('MLB_CASSETTE_NAME', 'default')  # One cassette per recorded slate
+CASSETTE_LATENCY_MS = float(os.environ.get('MLB_CASSETTE_LATENCY_MS', 0))  # Injected delay per replayed response
+CASSETTE_FORMAT_VERSION = 1  # Bump when the on-disk entry format changes
+
+CASSETTE_STATE = {
+    'manifest': None,
+    'recorded': 0,
+    'replayed': 0,
+    'missing': 0
+}
+CASSETTE_LOCK = threading.Lock()
+
+def get_cassette_path(*parts):
+    return os.path.join(CASSETTE_DIR, CASSETTE_NAME, *parts)
+
+def normalize_request_url(url, params=None):
+    """Canonical form of a request URL, with query parameters sorted, used as the cassette key"""
+    prepared = requests.Request('GET', url, params=params).prepare().url
+    parsed = requests.utils.urlparse(prepared)
+    query = '&'.join(sorted(parsed.query.split('&'))) if parsed.query else ''
+    return f"{parsed.scheme}://{parsed.netloc.lower()}{parsed.path}" + (f"?{query}" if query else '')
+
+def get_cassette_key(url, params=None):
+    return hashlib.sha1(normalize_request_url(url, params).encode('utf-8')).hexdigest()
+
+def load_cassette_manifest():
+    """Read the cassette manifest, refusing cassettes written in another format version"""
+    try:
+        with open(get_cassette_path('manifest.json')) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    
+    if manifest.get('format_version') != CASSETTE_FORMAT_VERSION:
+        raise ValueError(f"Cassette {CASSETTE_NAME} has format version {manifest.get('format_version')}, "
+                         f"expected {CASSETTE_FORMAT_VERSION}; re-record it")
+    return manifest
+
+def record_cassette_response(url, params, response):
+    """Write one upstream response into the cassette"""
+    entry = {
+        'url': normalize_request_url(url, params),
+        'status_code': response.status_code,
+        'headers': {k: v for k, v in response.headers.items()
+                    if k.lower() in ('content-type', 'etag', 'last-modified', 'cache-control')},
+        'body': response.content.decode('utf-8', errors='replace'),
+        'recorded_at': datetime.now().isoformat()
+    }
+    
+    try:
+        with CASSETTE_LOCK:
+            os.makedirs(get_cassette_path('responses'), exist_ok=True)
+            if CASSETTE_STATE['manifest'] is None:
+                CASSETTE_STATE['manifest'] = load_cassette_manifest() or {
+                    'format_version': CASSETTE_FORMAT_VERSION,
+                    'name': CASSETTE_NAME,
+                    'slate_date': get_mlb_today(),
+                    'season': CURRENT_SEASON,
+                    'created_at': datetime.now().isoformat()
+                }
+                with open(get_cassette_path('manifest.json'), 'w') as f:
+                    json.dump(CASSETTE_STATE['manifest'], f, indent=2)
+            
+            # Write then rename so a concurrent replay never reads a partial entry
+            path = get_cassette_path('responses', f"{get_cassette_key(url, params)}.json")
+            with open(path + '.tmp', 'w') as f:
+                json.dump(entry, f)
+            os.replace(path + '.tmp', path)
+            CASSETTE_STATE['recorded'] += 1
+    except Exception as e:
+        logger.error(f"Error recording cassette entry for {url}: {e}")
+
+def replay_cassette_response(url, params=None):
+    """
+    Serve a recorded response from the cassette.
+    
+    Raises requests.ConnectionError for requests that were never recorded,
+    so callers take the same error path as for an unreachable upstream.
+    """
+    path = get_cassette_path('responses', f"{get_cassette_key(url, params)}.json")
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        with CASSETTE_LOCK:
+            CASSETTE_STATE['missing'] += 1
+        raise requests.ConnectionError(f"No recorded response in cassette {CASSETTE_NAME} for {normalize_request_url(url, params)}")
+    
+    if CASSETTE_LATENCY_MS:
+        time.sleep(CASSETTE_LATENCY_MS / 1000)
+    
+    response = requests.Response()
+    response.status_code = entry['status_code']
+    response.headers = requests.structures.CaseInsensitiveDict(entry['headers'])
+    response._content = entry['body'].encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = entry['url']
+    with CASSETTE_LOCK:
+        CASSETTE_STATE['replayed'] += 1
+    return response
+
+if CASSETTE_MODE == 'replay':
+    CASSETTE_STATE['manifest'] = load_cassette_manifest()
+    if CASSETTE_STATE['manifest'] is None:
+        logger.warning(f"Replay mode enabled but cassette {CASSETTE_NAME} has no manifest in {CASSETTE_DIR}")
+    else:
+        logger.info(f"Replaying upstream responses from cassette {CASSETTE_NAME} "
+                    f"(slate {CASSETTE_STATE['manifest'].get('slate_date')})")
+elif CASSETTE_MODE == 'record':
+    logger.info(f"Recording upstream responses to cassette {CASSETTE_NAME} in {CASSETTE_DIR}")
+
+# Route statsapi's module-level requests.get() through the pooled session
+statsapi.requests = SimpleNamespace(get=http_get)
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
 # Eastern Time zone for MLB operations
 EASTERN_TZ = pytz.timezone('US/Eastern')
+MLB_DATE_OVERRIDE = os.environ.get('MLB_DATE_OVERRIDE')  # Pin the MLB day (YYYY-MM-DD), e.g. for replaying a recorded slate
 
 def get_mlb_today():
     """
     Get the current MLB day based on Eastern Time.
     The MLB day changes at 3 AM ET, so games before 3 AM are considered part of the previous day.
+    MLB_DATE_OVERRIDE, or the slate of a replayed cassette, pins the day instead.
     """
+    if MLB_DATE_OVERRIDE:
+        return MLB_DATE_OVERRIDE
+    if CASSETTE_MODE == 'replay' and CASSETTE_STATE['manifest']:
+        return CASSETTE_STATE['manifest']['slate_date']
+    
     now_et = datetime.now(EASTERN_TZ)
     
     # If it's before 3 AM ET, use the previous day
@@ -302,13 +667,330 @@ def require_admin(f):
 # Using 2025 for current season data
 CURRENT_SEASON = 2025 # Using 2025 for the current season
 
-# Cache for storing player stats to reduce API calls
-PLAYER_STATS_CACHE = {}
-TEAM_ROSTER_CACHE = {}
-SCHEDULE_CACHE = {}
 CACHE_TIMEOUT = 300  # Cache timeout in seconds (5 minutes)
 LAST_CACHE_CLEAR = time.time()
 ENABLE_CACHE = True  # Flag to enable/disable caching for debugging
+CACHE_SWEEP_INTERVAL = int(os.environ.get('CACHE_SWEEP_INTERVAL', 60))  # Seconds between background expiry sweeps
+
+# Shared cache settings, for sharing warm data between gunicorn workers on one node
+SHARED_CACHE_ENABLED = os.environ.get('SHARED_CACHE_ENABLED', '1') == '1'  # Back the in-memory caches with a shared SQLite store
+SHARED_CACHE_PATH = os.environ.get('SHARED_CACHE_PATH', 'shared_cache.sqlite')  # Put on local disk or /dev/shm, not a network share
+SHARED_CACHE_L1_TTL = int(os.environ.get('SHARED_CACHE_L1_TTL', 30))  # Max seconds a worker keeps its own copy of a shared entry
+
+def to_json_compatible(value):
+    """json.dumps default for the read-only mappings and sets used in cached data"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+class SharedCacheStore:
+    """
+    Cache table in a WAL-mode SQLite file shared by every worker on the node.
+    
+    Values are stored as JSON with a wall-clock expiry. Each thread keeps
+    its own connection, reopened after a fork. Errors are logged and treated
+    as misses so a locked or missing file never fails a request.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+    
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, cache_key)
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_leases (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+    
+    def get(self, namespace, key):
+        """Return (value, stored_at, expires_at) for a live entry, or None"""
+        try:
+            row = self._connect().execute(
+                'SELECT value, stored_at, expires_at FROM cache_entries WHERE namespace = ? AND cache_key = ? AND expires_at > ?',
+                (namespace, str(key), time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache read failed for {namespace}/{key}: {e}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+    
+    def set(self, namespace, key, value, ttl):
+        now = time.time()
+        try:
+            self._connect().execute(
+                'INSERT OR REPLACE INTO cache_entries (namespace, cache_key, value, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                (namespace, str(key), json.dumps(value, default=to_json_compatible), now, now + ttl)
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Shared cache write failed for {namespace}/{key}: {e}")
+    
+    def delete(self, namespace, key):
+        try:
+            self._connect().execute('DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?', (namespace, str(key)))
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache delete failed for {namespace}/{key}: {e}")
+    
+    def clear(self, namespace):
+        try:
+            self._connect().execute('DELETE FROM cache_entries WHERE namespace = ?', (namespace,))
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache clear failed for {namespace}: {e}")
+    
+    def purge_expired(self):
+        """Delete expired rows from every namespace; returns how many were removed"""
+        try:
+            return self._connect().execute('DELETE FROM cache_entries WHERE expires_at <= ?', (time.time(),)).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache purge failed: {e}")
+            return 0
+    
+    def stats(self, namespace):
+        try:
+            row = self._connect().execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM cache_entries WHERE namespace = ? AND expires_at > ?',
+                (namespace, time.time())
+            ).fetchone()
+            return {'entries': row[0], 'bytes': row[1]}
+        except sqlite3.Error as e:
+            logger.error(f"Shared cache stats failed for {namespace}: {e}")
+            return {'entries': None, 'bytes': None}
+    
+    def acquire_lease(self, name, ttl):
+        """
+        Take or renew a named lease for ttl seconds.
+        
+        Returns True if this process holds the lease, False if another live
+        process does. Used so one worker runs each scheduled job.
+        """
+        owner = f"{socket.gethostname()}:{os.getpid()}"
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute('''
+                INSERT INTO job_leases (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE job_leases.expires_at <= ? OR job_leases.owner = excluded.owner
+            ''', (name, owner, now + ttl, now))
+            row = conn.execute('SELECT owner FROM job_leases WHERE name = ?', (name,)).fetchone()
+            return row is not None and row[0] == owner
+        except sqlite3.Error as e:
+            # Without the shared store we can't coordinate, so run rather than skip the job
+            logger.error(f"Job lease check failed for {name}, running anyway: {e}")
+            return True
+
+SHARED_CACHE = SharedCacheStore(SHARED_CACHE_PATH) if SHARED_CACHE_ENABLED else None
+
+CACHE_AGE_BUCKETS = [(60, '<1m'), (300, '1-5m'), (900, '5-15m'), (3600, '15-60m'), (6 * 3600, '1-6h'), (float('inf'), '>6h')]
+
+def summarize_ages(ages):
+    """Bucket entry ages (seconds) for cache stats, with the oldest and median age"""
+    buckets = {label: 0 for _, label in CACHE_AGE_BUCKETS}
+    for age in ages:
+        for limit, label in CACHE_AGE_BUCKETS:
+            if age < limit:
+                buckets[label] += 1
+                break
+    ordered = sorted(ages)
+    return {
+        'buckets': buckets,
+        'median_seconds': round(ordered[len(ordered) // 2], 1) if ordered else None,
+        'oldest_seconds': round(ordered[-1], 1) if ordered else None
+    }
+
+def estimate_size(data):
+    """Approximate memory cost of a cached value, in bytes of its JSON form"""
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(data)
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry and LRU eviction.
+    
+    Each cache is a namespace with its own default TTL and budgets. When a
+    write takes it over max_entries or max_bytes, the least recently used
+    entries are evicted. Expired entries are dropped when read and by the
+    background sweeper, so keys nobody asks for again don't pile up.
+    
+    With a shared store, writes go to both levels and local misses are
+    filled from the store. A worker keeps its own copy for at most
+    SHARED_CACHE_L1_TTL seconds, so one worker's fetch warms every worker
+    and each worker only holds its recent hot set.
+    """
+    
+    def __init__(self, namespace, default_ttl=CACHE_TIMEOUT, max_entries=10000, max_bytes=32 * 1024 * 1024, shared=None):
+        self.namespace = namespace
+        self.shared = shared
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (data, expires_at, size, stored_at), least recently used first
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.shared_hits = 0
+    
+    def get(self, key):
+        """Return the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._remove(key)
+                self.expirations += 1
+        
+        shared_entry = self.shared.get(self.namespace, key) if self.shared else None
+        with self._lock:
+            if shared_entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.shared_hits += 1
+        
+        data, _, expires_at = shared_entry
+        self._store_local(key, data, expires_at - time.time())
+        return data
+    
+    def set(self, key, data, ttl=None):
+        """Store a value for ttl seconds (the namespace default if not given)"""
+        ttl = ttl if ttl is not None else self.default_ttl
+        if self.shared:
+            self.shared.set(self.namespace, key, data, ttl)
+        self._store_local(key, data, ttl)
+        return data
+    
+    def _store_local(self, key, data, ttl):
+        if self.shared:
+            ttl = min(ttl, SHARED_CACHE_L1_TTL)
+        size = estimate_size(data)
+        now = time.monotonic()
+        expires_at = now + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, expires_at, size, now)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+    
+    def delete(self, key):
+        if self.shared:
+            self.shared.delete(self.namespace, key)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+    
+    def sweep(self):
+        """Drop every expired entry; returns how many were removed"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry[1] <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        return len(expired)
+    
+    def clear(self):
+        if self.shared:
+            self.shared.clear(self.namespace)
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+    
+    def stats(self):
+        """Hit/miss/eviction counters, size and entry age distribution for this namespace"""
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - entry[3] for entry in self._entries.values()]
+            stats = {
+                'namespace': self.namespace,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'default_ttl': self.default_ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'shared_hits': self.shared_hits
+            }
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else None
+        stats['age_distribution'] = summarize_ages(ages)
+        if self.shared:
+            stats['shared'] = self.shared.stats(self.namespace)
+        return stats
+    
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+    
+    def __len__(self):
+        return len(self._entries)
+
+# Caches for player stats, rosters, schedules and matchups to reduce API calls
+ROSTER_CACHE_TIMEOUT = 12 * 3600  # Rosters change rarely; refetch at most once per daily refresh cycle
+PLAYER_STATS_CACHE = TTLCache('player_stats', default_ttl=CACHE_TIMEOUT, max_entries=20000, max_bytes=32 * 1024 * 1024, shared=SHARED_CACHE)
+TEAM_ROSTER_CACHE = TTLCache('team_rosters', default_ttl=ROSTER_CACHE_TIMEOUT, max_entries=500, max_bytes=16 * 1024 * 1024, shared=SHARED_CACHE)
+SCHEDULE_CACHE = TTLCache('schedule', default_ttl=300, max_entries=100, max_bytes=8 * 1024 * 1024, shared=SHARED_CACHE)
+TEAM_MATCHUP_CACHE = TTLCache('team_matchups', default_ttl=3600, max_entries=200, max_bytes=32 * 1024 * 1024, shared=SHARED_CACHE)
+CACHES = [PLAYER_STATS_CACHE, TEAM_ROSTER_CACHE, SCHEDULE_CACHE, TEAM_MATCHUP_CACHE]
+
+def sweep_caches_periodically():
+    """Background loop that drops expired entries from every cache"""
+    while True:
+        time.sleep(CACHE_SWEEP_INTERVAL)
+        try:
+            removed = sum(cache.sweep() for cache in CACHES)
+            if SHARED_CACHE:
+                removed += SHARED_CACHE.purge_expired()
+            if removed:
+                logger.info(f"Cache sweep removed {removed} expired entries")
+        except Exception as e:
+            logger.error(f"Error sweeping caches: {e}")
+
+threading.Thread(target=sweep_caches_periodically, daemon=True, name='cache-sweeper').start()
 
 # Daily data cache - this will hold pre-fetched data
 DAILY_DATA_CACHE = {
@@ -319,6 +1001,94 @@ DAILY_DATA_CACHE = {
     'update_date': None
 }
 
+# When this worker's copy of each daily data set was saved, keyed by "{data_type}_{date}"
+DAILY_DATA_VERSIONS = {}
+DAILY_DATA_SYNC_CHECKED = {}
+DAILY_DATA_SYNC_INTERVAL = 5  # Seconds between checks for daily data saved by other workers
+
+# Concurrent ingestion settings
+INGESTION_MAX_WORKERS = int(os.environ.get('INGESTION_MAX_WORKERS', 8))  # Max parallel upstream fetches per run
+UPSTREAM_CALL_TIMEOUT = float(os.environ.get('UPSTREAM_CALL_TIMEOUT', 20))  # Seconds to wait on a single fetch
+
+def run_concurrently(func, items, max_workers=None, timeout=None):
+    """
+    Run func over items on a bounded thread pool.
+
+    Results come back in the same order as items, as (result, error) tuples,
+    so callers can keep their own per-item error handling. A call that takes
+    longer than the timeout is reported as a TimeoutError.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    max_workers = max_workers or INGESTION_MAX_WORKERS
+    timeout = timeout or UPSTREAM_CALL_TIMEOUT
+
+    # Workers make their upstream calls with the caller's priority
+    priority = get_upstream_priority()
+    def run_item(item):
+        with upstream_priority(priority):
+            return func(item)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures = [executor.submit(run_item, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append((future.result(timeout=timeout), None))
+            except FuturesTimeoutError:
+                future.cancel()
+                results.append((None, TimeoutError(f"Timed out after {timeout} seconds")))
+            except Exception as e:
+                results.append((None, e))
+        return results
+    finally:
+        # Don't block on calls that already timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+SINGLE_FLIGHT_TIMEOUT = 120  # Seconds a coalesced caller waits for the in-flight computation
+
+# In-flight computations by key, for single_flight()
+IN_FLIGHT_CALLS = {}
+IN_FLIGHT_LOCK = threading.Lock()
+
+def single_flight(key, func, timeout=None):
+    """
+    Run func at most once at a time per key.
+    
+    The first caller runs func. Callers that arrive while it is in flight
+    wait for it and get the same result, or the same exception. Waiters
+    raise TimeoutError if the computation takes longer than timeout seconds.
+    """
+    timeout = timeout or SINGLE_FLIGHT_TIMEOUT
+    
+    with IN_FLIGHT_LOCK:
+        call = IN_FLIGHT_CALLS.get(key)
+        is_leader = call is None
+        if is_leader:
+            call = {'done': threading.Event(), 'result': None, 'error': None}
+            IN_FLIGHT_CALLS[key] = call
+    
+    if is_leader:
+        try:
+            call['result'] = func()
+        except Exception as e:
+            call['error'] = e
+        finally:
+            with IN_FLIGHT_LOCK:
+                IN_FLIGHT_CALLS.pop(key, None)
+            call['done'].set()
+    else:
+        logger.info(f"Waiting on in-flight computation for {key}")
+        if not call['done'].wait(timeout):
+            raise TimeoutError(f"Timed out after {timeout} seconds waiting for {key}")
+    
+    if call['error'] is not None:
+        raise call['error']
+    return call['result']
+
 # Database setup for persistent daily data storage
 DATABASE_PATH = os.environ.get('DATABASE_PATH', 'daily_mlb_data.sqlite')
 
@@ -400,6 +1170,31 @@ def init_database():
         )
     ''')
     
+    # Create table for precomputed per-team matchup data
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_matchups (
+            id INTEGER PRIMARY KEY,
+            team_id INTEGER NOT NULL,
+            data_date TEXT NOT NULL,
+            data_content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(team_id, data_date)
+        )
+    ''')
+    
+    # Create table for the player name <-> ID index
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS players (
+            player_id INTEGER PRIMARY KEY,
+            full_name TEXT NOT NULL,
+            name_key TEXT NOT NULL,
+            team_id INTEGER,
+            position TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_name_key ON players (name_key)')
+    
     conn.commit()
     conn.close()
     logger.info("Database initialized successfully")
@@ -417,12 +1212,46 @@ def save_daily_data(data_type, data_date, data_content):
         
         conn.commit()
         logger.info(f"Saved {data_type} data for {data_date}")
+        
+        # Tell other workers their in-memory copy is out of date
+        saved_at = time.time()
+        DAILY_DATA_VERSIONS[f"{data_type}_{data_date}"] = saved_at
+        if SHARED_CACHE:
+            SHARED_CACHE.set('daily_data', f"{data_type}_{data_date}", saved_at, 2 * 24 * 3600)
     except Exception as e:
         logger.error(f"Error saving {data_type} data: {e}")
         conn.rollback()
     finally:
         conn.close()
 
+def sync_daily_data(data_type, data_date):
+    """
+    Reload DAILY_DATA_CACHE from the database if another worker saved newer data.
+    
+    Checks the shared generation marker at most every DAILY_DATA_SYNC_INTERVAL
+    seconds per data type, so the hot path stays in memory.
+    """
+    if not SHARED_CACHE:
+        return
+    
+    key = f"{data_type}_{data_date}"
+    now = time.time()
+    if now - DAILY_DATA_SYNC_CHECKED.get(key, 0) < DAILY_DATA_SYNC_INTERVAL:
+        return
+    DAILY_DATA_SYNC_CHECKED[key] = now
+    
+    marker = SHARED_CACHE.get('daily_data', key)
+    if marker is None or marker[0] <= DAILY_DATA_VERSIONS.get(key, 0):
+        return
+    
+    data = load_daily_data(data_type, data_date)
+    if data:
+        logger.info(f"Reloading {data_type} data for {data_date} saved by another worker")
+        DAILY_DATA_CACHE[data_type] = data
+        DAILY_DATA_CACHE['update_date'] = data_date
+        DAILY_DATA_CACHE['last_updated'] = datetime.fromtimestamp(marker[0], EASTERN_TZ).isoformat()
+        DAILY_DATA_VERSIONS[key] = marker[0]
+
 def load_daily_data(data_type, data_date):
     """Load daily data from database"""
     conn = sqlite3.connect(DATABASE_PATH)
@@ -444,6 +1273,224 @@ def load_daily_data(data_type, data_date):
     finally:
         conn.close()
 
+def save_team_matchups(data_date, matchups):
+    """Save precomputed matchup data for many teams in one transaction"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.executemany('''
+            INSERT OR REPLACE INTO daily_matchups (team_id, data_date, data_content)
+            VALUES (?, ?, ?)
+        ''', [(team_id, data_date, json.dumps(data)) for team_id, data in matchups.items()])
+        
+        conn.commit()
+        logger.info(f"Saved matchup data for {len(matchups)} teams for {data_date}")
+    except Exception as e:
+        logger.error(f"Error saving matchup data: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def load_team_matchups(data_date, team_id=None):
+    """Load precomputed matchup data for a date (optionally a single team) as team_id -> data"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    try:
+        if team_id is None:
+            cursor.execute('SELECT team_id, data_content FROM daily_matchups WHERE data_date = ?', (data_date,))
+        else:
+            cursor.execute('''
+                SELECT team_id, data_content FROM daily_matchups 
+                WHERE data_date = ? AND team_id = ?
+            ''', (data_date, team_id))
+        
+        return {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+    except Exception as e:
+        logger.error(f"Error loading matchup data: {e}")
+        return {}
+    finally:
+        conn.close()
+
+# In-memory copy of the players table for O(1) name <-> ID resolution
+PLAYER_INDEX = {
+    'by_id': {},    # player_id -> {'full_name', 'team_id', 'position'}
+    'by_name': {}   # normalized name key -> [player_id, ...]
+}
+PLAYER_INDEX_LOCK = threading.Lock()
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+def normalize_player_name(name):
+    """Normalize a player name for matching: no accents, punctuation, case or Jr./Sr./II suffixes"""
+    if not name:
+        return ''
+    
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"[.'’]", '', name)
+    parts = re.sub(r'[^a-z0-9]+', ' ', name).split()
+    
+    while len(parts) > 1 and parts[-1] in NAME_SUFFIXES:
+        parts.pop()
+    return ' '.join(parts)
+
+def _add_to_player_index(player_id, full_name, team_id=None, position=None):
+    """Add or update one player in the in-memory index (caller holds PLAYER_INDEX_LOCK)"""
+    existing = PLAYER_INDEX['by_id'].get(player_id)
+    if existing and existing['full_name'] != full_name:
+        old_ids = PLAYER_INDEX['by_name'].get(normalize_player_name(existing['full_name']), [])
+        if player_id in old_ids:
+            old_ids.remove(player_id)
+    
+    PLAYER_INDEX['by_id'][player_id] = {'full_name': full_name, 'team_id': team_id, 'position': position}
+    ids = PLAYER_INDEX['by_name'].setdefault(normalize_player_name(full_name), [])
+    if player_id not in ids:
+        ids.append(player_id)
+
+def load_player_index():
+    """Load the players table into memory"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('SELECT player_id, full_name, team_id, position FROM players')
+        rows = cursor.fetchall()
+        
+        with PLAYER_INDEX_LOCK:
+            PLAYER_INDEX['by_id'].clear()
+            PLAYER_INDEX['by_name'].clear()
+            for player_id, full_name, team_id, position in rows:
+                _add_to_player_index(player_id, full_name, team_id, position)
+        
+        logger.info(f"Loaded {len(rows)} players into the player index")
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error loading player index: {e}")
+        return 0
+    finally:
+        conn.close()
+
+def index_players(players):
+    """
+    Add players to the index, writing only new or changed rows.
+    
+    Args:
+        players: Iterable of dicts with player_id, full_name and optional team_id/position
+    
+    Returns:
+        Number of rows written
+    """
+    changed = []
+    with PLAYER_INDEX_LOCK:
+        for player in players:
+            player_id = player.get('player_id')
+            full_name = player.get('full_name')
+            if not player_id or not full_name:
+                continue
+            
+            player_id = int(player_id)
+            team_id = player.get('team_id')
+            position = player.get('position')
+            existing = PLAYER_INDEX['by_id'].get(player_id)
+            
+            # Keep what we already know when a source doesn't carry team/position
+            if existing:
+                team_id = team_id or existing['team_id']
+                position = position or existing['position']
+                if (existing['full_name'], existing['team_id'], existing['position']) == (full_name, team_id, position):
+                    continue
+            
+            _add_to_player_index(player_id, full_name, team_id, position)
+            changed.append((player_id, full_name, normalize_player_name(full_name), team_id, position))
+    
+    if not changed:
+        return 0
+    
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.executemany('''
+            INSERT INTO players (player_id, full_name, name_key, team_id, position, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(player_id) DO UPDATE SET
+                full_name = excluded.full_name,
+                name_key = excluded.name_key,
+                team_id = excluded.team_id,
+                position = excluded.position,
+                updated_at = CURRENT_TIMESTAMP
+        ''', changed)
+        conn.commit()
+        logger.info(f"Indexed {len(changed)} new or changed players")
+        return len(changed)
+    except Exception as e:
+        logger.error(f"Error saving player index: {e}")
+        conn.rollback()
+        return 0
+    finally:
+        conn.close()
+
+@background_job
+def refresh_player_index(season=None):
+    """Rebuild the player index from a league-wide sweep of every player on a roster this season"""
+    season = season or CURRENT_SEASON
+    logger.info(f"Refreshing player index for {season}")
+    
+    try:
+        players_data = statsapi.get('sports_players', {
+            'sportId': 1,
+            'season': season,
+            'fields': 'people,id,fullName,currentTeam,id,primaryPosition,abbreviation'
+        })
+        
+        changed = index_players({
+            'player_id': person.get('id'),
+            'full_name': person.get('fullName'),
+            'team_id': person.get('currentTeam', {}).get('id'),
+            'position': person.get('primaryPosition', {}).get('abbreviation')
+        } for person in players_data.get('people', []))
+        
+        logger.info(f"Player index refresh complete: {len(PLAYER_INDEX['by_id'])} players, {changed} updated")
+        return changed
+    except Exception as e:
+        logger.error(f"Error refreshing player index: {e}")
+        return 0
+
+def resolve_player_id(player_name, team_id=None):
+    """
+    Resolve a player name to an ID from the local index (no network calls).
+    
+    When several players share a normalized name, the one on team_id wins.
+    Returns None if the name isn't indexed.
+    """
+    with PLAYER_INDEX_LOCK:
+        player_ids = list(PLAYER_INDEX['by_name'].get(normalize_player_name(player_name), []))
+        if team_id is not None:
+            for player_id in player_ids:
+                if PLAYER_INDEX['by_id'][player_id]['team_id'] == team_id:
+                    return player_id
+    
+    return player_ids[0] if player_ids else None
+
+def lookup_player_id(player_name, team_id=None):
+    """Resolve a player name to an ID, falling back to the MLB API (and indexing the result) on an index miss"""
+    player_id = resolve_player_id(player_name, team_id)
+    if player_id is not None:
+        return player_id
+    
+    player_lookup = statsapi.lookup_player(player_name)
+    if player_lookup and isinstance(player_lookup, list) and isinstance(player_lookup[0], dict) and player_lookup[0].get('id'):
+        index_players({
+            'player_id': player.get('id'),
+            'full_name': player.get('fullName'),
+            'team_id': player.get('currentTeam', {}).get('id'),
+            'position': player.get('primaryPosition', {}).get('abbreviation')
+        } for player in player_lookup if isinstance(player, dict))
+        return player_lookup[0]['id']
+    
+    return None
+
 def create_article(title, content, summary="", author="MLB Analyst", tags="", status="published"):
     """Create a new blog article"""
     conn = sqlite3.connect(DATABASE_PATH)
@@ -644,18 +1691,36 @@ def delete_article(article_id):
     finally:
         conn.close()
 
-def fetch_daily_pitchers_data(date_str):
-    """Fetch and process all pitcher data for the day"""
+def fetch_daily_pitchers_data(date_str, max_workers=None, timeout=None):
+    """
+    Fetch and process all pitcher data for the day.
+
+    Probable starters are fetched in parallel on a bounded worker pool
+    (max_workers, default INGESTION_MAX_WORKERS), with each pitcher's fetch
+    limited to timeout seconds. Output order follows the schedule.
+    """
     logger.info(f"Fetching pitcher data for {date_str}")
+    run_start_time = time.time()
+    max_workers = max_workers or INGESTION_MAX_WORKERS
+    
+    # Count upstream calls made during this run (workers update it concurrently)
+    call_counter = {'calls': 0}
+    call_counter_lock = threading.Lock()
+    
+    def count_call():
+        with call_counter_lock:
+            call_counter['calls'] += 1
     
     try:
-        schedule = statsapi.schedule(date=date_str, sportId=1)
+        if get_cached_data(SCHEDULE_CACHE, f"schedule_{date_str}") is None:
+            count_call()
+        schedule = get_daily_schedule(date_str)
         
         if not schedule:
             logger.warning(f"No games scheduled for {date_str}")
             return {'error': 'No games scheduled', 'pitchers_data': []}
         
-        games_data = []
+        pitchers_to_process = []
         
         for game in schedule:
             try:
@@ -669,183 +1734,294 @@ def fetch_daily_pitchers_data(date_str):
                 relevant_statuses_for_probable_pitchers = {"Scheduled", "Pre-Game", "Preview", "Live"}
                 
                 if current_game_status_string in relevant_statuses_for_probable_pitchers:
-                    home_pitcher_name_from_schedule = game.get('home_probable_pitcher')
-                    away_pitcher_name_from_schedule = game.get('away_probable_pitcher')
-                    
                     home_team_name = game.get('home_name', "N/A")
                     away_team_name = game.get('away_name', "N/A")
                     home_team_id = game.get('home_id')
                     away_team_id = game.get('away_id')
 
-                    pitchers_to_process = []
-                    if home_pitcher_name_from_schedule:
+                    # Probable pitcher IDs come hydrated on the schedule, so no name lookup is needed
+                    if game.get('home_probable_pitcher'):
                         pitchers_to_process.append({
-                            "name_on_schedule": home_pitcher_name_from_schedule, 
+                            "name_on_schedule": game.get('home_probable_pitcher'),
+                            "player_id": game.get('home_probable_pitcher_id'),
                             "team_name": home_team_name, 
+                            "team_id": home_team_id,
                             "opponent_name": away_team_name,
                             "opponent_id": away_team_id
                         })
-                    if away_pitcher_name_from_schedule:
+                    if game.get('away_probable_pitcher'):
                         pitchers_to_process.append({
-                            "name_on_schedule": away_pitcher_name_from_schedule, 
+                            "name_on_schedule": game.get('away_probable_pitcher'),
+                            "player_id": game.get('away_probable_pitcher_id'),
                             "team_name": away_team_name, 
+                            "team_id": away_team_id,
                             "opponent_name": home_team_name,
                             "opponent_id": home_team_id
                         })
-
-                    for p_detail in pitchers_to_process:
-                        pitcher_display_name = p_detail["name_on_schedule"]
-                        actual_player_id = None
-                        pitcher_stats = {}
-
-                        try:
-                            # Look up player ID
-                            player_lookup_results = statsapi.lookup_player(pitcher_display_name)
-                            
-                            if (player_lookup_results and isinstance(player_lookup_results, list) and 
-                                len(player_lookup_results) > 0 and isinstance(player_lookup_results[0], dict) and 
-                                player_lookup_results[0].get('id')):
-                                actual_player_id = player_lookup_results[0]['id']
-                                
-                                # Fetch stats using the player ID
-                                pitcher_stats = get_player_stats(actual_player_id, group="pitching", type="season")
-                                
-                                # Extract stats
-                                batters_faced = pitcher_stats.get('battersFaced', "N/A")
-                                home_runs_allowed = pitcher_stats.get('homeRuns', "N/A")
-                                
-                                games_data.append({
-                                    'name': pitcher_display_name,
-                                    'team': p_detail["team_name"],
-                                    'opponent': p_detail["opponent_name"],
-                                    'opponent_id': p_detail["opponent_id"],
-                                    'batters_faced': batters_faced,
-                                    'home_runs_allowed': home_runs_allowed
-                                })
-                            else:
-                                games_data.append({
-                                    'name': pitcher_display_name,
-                                    'team': p_detail["team_name"],
-                                    'opponent': p_detail["opponent_name"],
-                                    'opponent_id': p_detail["opponent_id"],
-                                    'batters_faced': "ID Lookup Error",
-                                    'home_runs_allowed': "ID Lookup Error"
-                                })
-
-                        except Exception as e:
-                            logger.error(f"Error processing pitcher '{pitcher_display_name}': {e}")
-                            games_data.append({
-                                'name': pitcher_display_name,
-                                'team': p_detail["team_name"],
-                                'opponent': p_detail["opponent_name"],
-                                'opponent_id': p_detail["opponent_id"],
-                                'batters_faced': "Fetch Error",
-                                'home_runs_allowed': "Fetch Error"
-                            })
                 
             except Exception as e:
                 logger.error(f"Error processing game {game.get('game_id', 'unknown')}: {e}")
                 continue
         
-        result = {'pitchers_data': games_data, 'total_games': len(games_data)}
-        logger.info(f"Successfully fetched pitcher data for {len(games_data)} games")
+        def pitcher_entry(p_detail, batters_faced, home_runs_allowed):
+            return {
+                'name': p_detail["name_on_schedule"],
+                'player_id': p_detail["player_id"],
+                'team': p_detail["team_name"],
+                'team_id': p_detail["team_id"],
+                'opponent': p_detail["opponent_name"],
+                'opponent_id': p_detail["opponent_id"],
+                'batters_faced': batters_faced,
+                'home_runs_allowed': home_runs_allowed
+            }
+        
+        def fetch_pitcher(p_detail):
+            player_id = p_detail["player_id"]
+            if not player_id:
+                return pitcher_entry(p_detail, "ID Lookup Error", "ID Lookup Error")
+            
+            # Fetch stats using the player ID
+            if get_cached_data(PLAYER_STATS_CACHE, f"{player_id}_pitching_season") is None:
+                count_call()
+            pitcher_stats = get_player_stats(player_id, group="pitching", type="season")
+            
+            # Extract stats
+            return pitcher_entry(p_detail,
+                                 pitcher_stats.get('battersFaced', "N/A"),
+                                 pitcher_stats.get('homeRuns', "N/A"))
+        
+        games_data = []
+        results = run_concurrently(fetch_pitcher, pitchers_to_process, max_workers=max_workers, timeout=timeout)
+        for p_detail, (entry, error) in zip(pitchers_to_process, results):
+            if error is not None:
+                logger.error(f"Error processing pitcher '{p_detail['name_on_schedule']}': {error}")
+                entry = pitcher_entry(p_detail, "Fetch Error", "Fetch Error")
+            games_data.append(entry)
+        
+        duration = time.time() - run_start_time
+        result = {
+            'pitchers_data': games_data,
+            'total_games': len(games_data),
+            'fetch_stats': {
+                'duration_seconds': round(duration, 2),
+                'upstream_calls': call_counter['calls'],
+                'max_workers': max_workers
+            }
+        }
+        logger.info(f"Successfully fetched pitcher data for {len(games_data)} games "
+                    f"in {duration:.2f} seconds ({call_counter['calls']} upstream calls, {max_workers} workers)")
         return result
         
     except Exception as e:
         logger.error(f"Error in fetch_daily_pitchers_data: {e}")
         return {'error': str(e), 'pitchers_data': []}
 
-def fetch_home_run_odds():
-    """Fetch today's home run odds from the external API"""
-    odds_url = "https://djstrauss08.github.io/HomeRunOdds//api/v1/homerun-props.json"
-    
-    # Initialize the player_odds dictionary
+ODDS_FEED_URL = os.environ.get('ODDS_FEED_URL', "https://djstrauss08.github.io/HomeRunOdds//api/v1/homerun-props.json")  # Point at mlb_stub_server.py for load tests
+ODDS_REFRESH_INTERVAL = 300  # Seconds before the odds feed is revalidated
+
+# Immutable, parsed view of one version of the odds feed, shared by every consumer
+OddsSnapshot = namedtuple('OddsSnapshot', ['player_odds', 'teams_covered', 'games', 'content_hash', 'fetched_at'])
+EMPTY_ODDS_SNAPSHOT = OddsSnapshot(MappingProxyType({}), frozenset(), (), None, None)
+
+ODDS_STATE = {
+    'snapshot': None,
+    'etag': None,
+    'last_modified': None,
+    'checked_at': 0
+}
+ODDS_LOCK = threading.Lock()
+
+def build_odds_snapshot(odds_data, content_hash):
+    """Parse the odds feed into player odds and team coverage in a single pass"""
     player_odds = {}
+    teams_covered = set()
+    games = []
     
-    try:
-        logger.info("Fetching home run odds data")
-        response = requests.get(odds_url, timeout=10)
-        response.raise_for_status()
-        
-        odds_data = response.json()
-        
-        # Log games with odds available
-        games_with_odds = []
-        for game in odds_data.get('games', []):
-            away_team = game.get('away_team')
-            home_team = game.get('home_team')
-            games_with_odds.append(f"{away_team} @ {home_team}")
-            
-            for player in game.get('players', []):
-                if player.get('line') == 0.5:  # Only "To Hit HR" props
-                    player_name = player.get('player_name')
-                    consensus_odds = player.get('over_odds', {}).get('consensus')
-                    sportsbook_count = player.get('sportsbook_count', 0)
+    for game in odds_data.get('games', []):
+        away_team = game.get('away_team', '')
+        home_team = game.get('home_team', '')
+        games.append(f"{away_team} @ {home_team}")
+        teams_covered.add(away_team)
+        teams_covered.add(home_team)
+        
+        for player in game.get('players', []):
+            if player.get('line') == 0.5:  # Only "To Hit HR" props
+                player_name = player.get('player_name')
+                consensus_odds = player.get('over_odds', {}).get('consensus')
+                sportsbook_count = player.get('sportsbook_count', 0)
+                
+                if consensus_odds and sportsbook_count > 0:
+                    # Format odds with + sign for positive odds
+                    if str(consensus_odds).isdigit():
+                        formatted_odds = f"+{consensus_odds}"
+                    else:
+                        formatted_odds = str(consensus_odds)
                     
-                    if consensus_odds and sportsbook_count > 0:
-                        # Format odds with + sign for positive odds
-                        if str(consensus_odds).isdigit():
-                            formatted_odds = f"+{consensus_odds}"
-                        else:
-                            formatted_odds = str(consensus_odds)
-                        
-                        player_odds[player_name] = {
-                            'odds': formatted_odds,
-                            'raw_odds': consensus_odds,
-                            'sportsbook_count': sportsbook_count
-                        }
-        
-        logger.info(f"Odds available for {len(games_with_odds)} games: {', '.join(games_with_odds)}")
-        logger.info(f"Total players with HR odds: {len(player_odds)}")
+                    player_odds[player_name] = MappingProxyType({
+                        'odds': formatted_odds,
+                        'raw_odds': consensus_odds,
+                        'sportsbook_count': sportsbook_count
+                    })
+    
+    return OddsSnapshot(
+        player_odds=MappingProxyType(player_odds),
+        teams_covered=frozenset(teams_covered),
+        games=tuple(games),
+        content_hash=content_hash,
+        fetched_at=get_eastern_time().isoformat()
+    )
+
+def get_odds_snapshot(force_refresh=False):
+    """
+    Get the current odds snapshot, fetching the feed at most once per ODDS_REFRESH_INTERVAL.
+    
+    Revalidation uses ETag/Last-Modified conditional requests, and the snapshot
+    is only rebuilt when the feed content actually changes. Concurrent callers
+    wait for the same fetch and all get the same immutable snapshot.
+    """
+    with ODDS_LOCK:
+        snapshot = ODDS_STATE['snapshot']
+        if not force_refresh and snapshot is not None and time.time() - ODDS_STATE['checked_at'] < ODDS_REFRESH_INTERVAL:
+            return snapshot
+        
+        headers = {}
+        if snapshot is not None:
+            if ODDS_STATE['etag']:
+                headers['If-None-Match'] = ODDS_STATE['etag']
+            if ODDS_STATE['last_modified']:
+                headers['If-Modified-Since'] = ODDS_STATE['last_modified']
         
-        return player_odds
+        try:
+            logger.info("Fetching home run odds data")
+            # The snapshot is our cache for the feed, so this session has no response cache
+            response = http_get(ODDS_FEED_URL, session=ODDS_HTTP_SESSION, headers=headers, timeout=10)
+            ODDS_STATE['checked_at'] = time.time()
+            
+            if response.status_code == 304 and snapshot is not None:
+                logger.info("Home run odds unchanged (304 Not Modified)")
+                return snapshot
+            response.raise_for_status()
+            
+            ODDS_STATE['etag'] = response.headers.get('ETag')
+            ODDS_STATE['last_modified'] = response.headers.get('Last-Modified')
+            
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            if snapshot is not None and snapshot.content_hash == content_hash:
+                logger.info("Home run odds content unchanged")
+                return snapshot
+            
+            snapshot = build_odds_snapshot(response.json(), content_hash)
+            ODDS_STATE['snapshot'] = snapshot
+            
+            logger.info(f"Odds available for {len(snapshot.games)} games: {', '.join(snapshot.games)}")
+            logger.info(f"Total players with HR odds: {len(snapshot.player_odds)}")
+        except Exception as e:
+            # Keep serving the last good snapshot and retry after the refresh interval
+            ODDS_STATE['checked_at'] = time.time()
+            logger.error(f"Error fetching home run odds: {e}")
         
-    except Exception as e:
-        logger.error(f"Error fetching home run odds: {e}")
-        return {}
+        return ODDS_STATE['snapshot'] or EMPTY_ODDS_SNAPSHOT
 
-def fetch_daily_hitters_data():
-    """Fetch and process all hitter data for the day"""
-    logger.info("Fetching daily hitter data")
+def invalidate_odds_snapshot():
+    """Force the next get_odds_snapshot() call to revalidate the odds feed"""
+    with ODDS_LOCK:
+        ODDS_STATE['checked_at'] = 0
+
+def fetch_home_run_odds():
+    """Get today's home run odds (player name -> odds) from the shared odds snapshot"""
+    return get_odds_snapshot().player_odds
+
+# How deep the daily hitters leaderboard goes: a number of leaders, or 'all' for every qualified hitter
+HITTER_LEADERS_LIMIT = os.environ.get('HITTER_LEADERS_LIMIT', '50')
+
+def fetch_league_leaders(category='homeRuns', stat_group='hitting', limit=50, season=CURRENT_SEASON):
+    """
+    Fetch league leaders as structured data.
+    
+    Unlike statsapi.league_leaders(), each entry keeps the person and team
+    IDs from the API, so no name lookups are needed afterwards.
+    
+    Args:
+        category: Leader category (e.g. homeRuns)
+        stat_group: The stats group (hitting/pitching)
+        limit: Number of leaders, or 'all' for every qualified player
+        season: The season to rank
+    
+    Returns:
+        List of dicts with rank, name, person_id, team_id, team_name and value
+    """
+    params = {
+        'leaderCategories': category,
+        'statGroup': stat_group,
+        'season': season,
+        'sportId': 1,
+        'fields': 'leagueLeaders,leaders,rank,value,team,id,name,person,id,fullName'
+    }
+    if str(limit).lower() == 'all':
+        params['playerPool'] = 'Qualified'
+        params['limit'] = 1000  # More than the number of qualified players in a season
+    else:
+        params['limit'] = int(limit)
+    
+    leaders_raw = statsapi.get('stats_leaders', params)
+    
+    leaders = []
+    for category_leaders in leaders_raw.get('leagueLeaders', [])[:1]:
+        for leader in category_leaders.get('leaders', []):
+            leaders.append({
+                'rank': leader.get('rank'),
+                'name': leader.get('person', {}).get('fullName'),
+                'person_id': leader.get('person', {}).get('id'),
+                'team_id': leader.get('team', {}).get('id'),
+                'team_name': leader.get('team', {}).get('name', "N/A"),
+                'value': leader.get('value')
+            })
+    
+    index_players({
+        'player_id': leader['person_id'],
+        'full_name': leader['name'],
+        'team_id': leader['team_id']
+    } for leader in leaders)
+    
+    return leaders
+
+def fetch_daily_hitters_data(limit=None):
+    """
+    Fetch and process all hitter data for the day.
+    
+    limit sets the leaderboard depth (a number, or 'all' for every qualified
+    hitter) and defaults to HITTER_LEADERS_LIMIT.
+    """
+    limit = limit or HITTER_LEADERS_LIMIT
+    logger.info(f"Fetching daily hitter data (leaders: {limit})")
     
     try:
-        # Fetch home run odds first
-        odds_data = fetch_home_run_odds()
+        # Fetch home run odds first; the snapshot also carries which teams have odds coverage
+        odds_snapshot = get_odds_snapshot()
+        odds_data = odds_snapshot.player_odds
+        games_with_odds = odds_snapshot.teams_covered
         
-        # Get list of games with odds coverage for better user feedback
-        games_with_odds = set()
+        # Fetch league leaders for home runs (structured, with person and team IDs)
         try:
-            odds_url = "https://djstrauss08.github.io/HomeRunOdds//api/v1/homerun-props.json"
-            response = requests.get(odds_url, timeout=10)
-            if response.status_code == 200:
-                odds_json = response.json()
-                for game in odds_json.get('games', []):
-                    away_team = game.get('away_team', '')
-                    home_team = game.get('home_team', '')
-                    games_with_odds.add(away_team)
-                    games_with_odds.add(home_team)
+            leaders = fetch_league_leaders('homeRuns', stat_group='hitting', limit=limit, season=CURRENT_SEASON)
         except Exception as e:
-            logger.warning(f"Could not fetch games with odds coverage: {e}")
-        
-        # Fetch league leaders for home runs  
-        leaders_raw = statsapi.league_leaders('homeRuns', statGroup='hitting', limit=50, season=CURRENT_SEASON, sportId=1)
-        
-        # Check if the response is a string (likely the formatted table)
-        if isinstance(leaders_raw, str):
+            # Fall back to the formatted leaders table
+            logger.warning(f"Structured leaders fetch failed, falling back to text table: {e}")
+            fallback_limit = 1000 if str(limit).lower() == 'all' else int(limit)
+            leaders_raw = statsapi.league_leaders('homeRuns', statGroup='hitting', limit=fallback_limit, season=CURRENT_SEASON, sportId=1)
             leaders = parse_league_leaders_string(leaders_raw)
-        else:
-            leaders = leaders_raw
-            
+        
         if not leaders:
             logger.error("No leaders data found or parsing failed")
             return {'error': "No home run leaders data available", 'hitters_data': []}
         
         # Use the same date as pitchers_api
         today_str = get_mlb_today()
-        schedule_today = statsapi.schedule(date=today_str, sportId=1)
+        schedule_today = get_daily_schedule(today_str)
         
-        # Create mapping of player names to opponents for today's games
-        player_name_to_opponent = {}  # player_name -> opponent_name
+        # Create mapping of player IDs to opponents for today's games
+        player_id_to_opponent = {}  # player_id -> opponent_name
+        team_opponents = {}  # team_id -> opponent_name
         
         if isinstance(schedule_today, list) and schedule_today:
             for game in schedule_today:
@@ -853,42 +2029,24 @@ def fetch_daily_hitters_data():
                     continue
                 home_team_id = game.get('home_id')
                 away_team_id = game.get('away_id')
-                home_team_name = game.get('home_name', "N/A")
-                away_team_name = game.get('away_name', "N/A")
-
-                # Get rosters and map players to opponents
                 if home_team_id and away_team_id:
-                    try:
-                        # Get home team roster
-                        home_roster = statsapi.roster(home_team_id, season=CURRENT_SEASON)
-                        if isinstance(home_roster, str):
-                            for line in home_roster.split('\n'):
-                                if line.strip() and '#' in line:
-                                    # Parse format like "#99  RF  Aaron Judge"
-                                    parts = line.strip().split()
-                                    if len(parts) >= 3:
-                                        # Player name is everything after position
-                                        player_name = ' '.join(parts[2:])
-                                        player_name_to_opponent[player_name] = away_team_name
-                        
-                        # Get away team roster  
-                        away_roster = statsapi.roster(away_team_id, season=CURRENT_SEASON)
-                        if isinstance(away_roster, str):
-                            for line in away_roster.split('\n'):
-                                if line.strip() and '#' in line:
-                                    # Parse format like "#99  RF  Aaron Judge"
-                                    parts = line.strip().split()
-                                    if len(parts) >= 3:
-                                        # Player name is everything after position
-                                        player_name = ' '.join(parts[2:])
-                                        player_name_to_opponent[player_name] = home_team_name
-                                        
-                    except Exception as e:
-                        logger.error(f"Error fetching rosters for game {home_team_name} vs {away_team_name}: {e}")
-                        continue
-
-        logger.info(f"Found {len(player_name_to_opponent)} players with games today")
+                    team_opponents[home_team_id] = game.get('away_name', "N/A")
+                    team_opponents[away_team_id] = game.get('home_name', "N/A")
+        
+        # Get rosters (shared roster cache, each team fetched at most once) and map players to opponents
+        team_ids = list(team_opponents)
+        for team_id, (roster, error) in zip(team_ids, run_concurrently(get_team_roster, team_ids)):
+            if error is not None:
+                logger.error(f"Error fetching roster for team {team_id}: {error}")
+                continue
+            for roster_entry in roster:
+                player_id_to_opponent[roster_entry['person_id']] = team_opponents[team_id]
 
+        logger.info(f"Found {len(player_id_to_opponent)} players with games today")
+
+        # Warm the stats cache for all leaders in a few multi-player requests
+        get_players_stats_batch([leader.get('person_id') for leader in leaders], group="hitting", types=("season",))
+        
         # Process each leader
         hitters_data = []
         for leader in leaders:
@@ -897,7 +2055,7 @@ def fetch_daily_hitters_data():
                 if not player_id:
                     continue
                 
-                player_name = leader.get('name', get_player_name(player_id))
+                player_name = leader.get('name') or get_player_name(player_id)
                 team_name = leader.get('team_name', "N/A")
                 home_runs = leader.get('value')
                 
@@ -905,8 +2063,8 @@ def fetch_daily_hitters_data():
                 player_stats = get_player_stats(player_id, group="hitting", type="season")
                 at_bats = player_stats.get('atBats', "N/A")
                 
-                # Check if we have a matchup today by player name
-                opponent_today = player_name_to_opponent.get(player_name, "No game today")
+                # Check if we have a matchup today by player ID
+                opponent_today = player_id_to_opponent.get(player_id, "No game today")
                 
                 # Get today's odds for this player
                 player_odds = odds_data.get(player_name, {})
@@ -920,7 +2078,9 @@ def fetch_daily_hitters_data():
                 
                 hitters_data.append({
                     'name': player_name,
+                    'player_id': player_id,
                     'team': team_name,
+                    'team_id': leader.get('team_id'),
                     'opponent_today': opponent_today,
                     'at_bats': at_bats,
                     'home_runs': home_runs,
@@ -937,11 +2097,11 @@ def fetch_daily_hitters_data():
                          reverse=True)
         
         result = {
-            'hitters_data': hitters_data[:50], 
+            'hitters_data': hitters_data, 
             'total_hitters': len(hitters_data),
             'odds_coverage': {
                 'games_with_odds': len(games_with_odds) // 2,  # Divide by 2 since we count both teams
-                'teams_covered': list(games_with_odds)
+                'teams_covered': sorted(games_with_odds)
             }
         }
         logger.info(f"Successfully fetched hitter data for {len(hitters_data)} players")
@@ -952,6 +2112,7 @@ def fetch_daily_hitters_data():
         logger.error(f"Error in fetch_daily_hitters_data: {e}")
         return {'error': str(e), 'hitters_data': []}
 
+@background_job
 def daily_data_update():
     """Main function to update all daily data at 3AM"""
     logger.info("Starting daily data update...")
@@ -970,8 +2131,8 @@ def daily_data_update():
         save_daily_data('hitters', today_str, hitter_data)
         DAILY_DATA_CACHE['hitters'] = hitter_data
         
-        # Fetch schedule data
-        schedule_data = statsapi.schedule(date=today_str, sportId=1)
+        # Fetch schedule data (shared with the pitcher and hitter fetches above)
+        schedule_data = get_daily_schedule(today_str)
         save_daily_data('schedule', today_str, schedule_data)
         DAILY_DATA_CACHE['schedule'] = schedule_data
         
@@ -979,6 +2140,9 @@ def daily_data_update():
         DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
         DAILY_DATA_CACHE['update_date'] = today_str
         
+        # Precompute matchup data for every team playing today
+        precompute_slate_matchups(today_str)
+        
         # Note: Pitcher report generation moved exclusively to 11 AM scheduled task
         # No backup generation in daily update to avoid duplicate articles
         
@@ -1004,6 +2168,8 @@ def cleanup_old_data():
         # Delete old data
         cursor.execute("DELETE FROM daily_data WHERE data_date < ?", (cutoff_date,))
         deleted_rows = cursor.rowcount
+        cursor.execute("DELETE FROM daily_matchups WHERE data_date < ?", (cutoff_date,))
+        deleted_rows += cursor.rowcount
         
         conn.commit()
         conn.close()
@@ -1012,51 +2178,51 @@ def cleanup_old_data():
     except Exception as e:
         logger.error(f"Error cleaning up old data: {e}")
 
-# Popular teams to preload (most viewed teams)
-POPULAR_TEAMS = [
-    147,  # New York Yankees
-    121,  # New York Mets  
-    119,  # Los Angeles Dodgers
-    117,  # Houston Astros
-    111,  # Boston Red Sox
-    108,  # Los Angeles Angels
-    145,  # Chicago White Sox
-    112,  # Chicago Cubs
-    158,  # Milwaukee Brewers
-    143   # Philadelphia Phillies
-]
+def precompute_slate_matchups(date_str=None):
+    """
+    Build matchup data for every team on the day's schedule in parallel.
+    
+    Results are cached in memory and saved as per-team rows in daily_matchups,
+    which every worker loads at startup, so matchup requests on a game day
+    are served without running the cold path.
+    """
+    date_str = date_str or get_mlb_today()
+    start_time = time.time()
+    
+    schedule = get_daily_schedule(date_str)
+    team_ids = list(dict.fromkeys(
+        team_id for game in schedule or [] if isinstance(game, dict)
+        for team_id in (game.get('home_id'), game.get('away_id')) if team_id
+    ))
+    if not team_ids:
+        logger.info(f"No teams scheduled for {date_str}, skipping matchup precompute")
+        return 0
+    
+    logger.info(f"Precomputing matchup data for {len(team_ids)} teams on {date_str}")
+    matchups = {}
+    for team_id, (result, error) in zip(team_ids, run_concurrently(build_team_matchup, team_ids)):
+        if error is not None or not result or result.get('error'):
+            logger.warning(f"Could not precompute matchup for team {team_id}: {error or (result or {}).get('error')}")
+            continue
+        matchups[team_id] = result
+    
+    if matchups:
+        save_team_matchups(date_str, matchups)
+    
+    logger.info(f"Precomputed matchups for {len(matchups)}/{len(team_ids)} teams in {time.time() - start_time:.2f} seconds")
+    return len(matchups)
 
+@background_job
 def preload_popular_teams():
-    """Preload matchup data for popular teams in background"""
-    logger.info("Starting background preload of popular teams...")
+    """Refresh precomputed matchup data for every team on today's slate"""
+    logger.info("Starting background matchup refresh for today's slate...")
     
-    for i, team_id in enumerate(POPULAR_TEAMS):
-        try:
-            cache_key = f"matchup_{team_id}_{CURRENT_SEASON}"
-            cached_data = get_cached_data(TEAM_MATCHUP_CACHE, cache_key)
-            
-            if cached_data is None:
-                logger.info(f"Preloading team {team_id}... ({i+1}/{len(POPULAR_TEAMS)})")
-                # Make internal request to populate cache
-                with app.test_client() as client:
-                    response = client.get(f'/api/matchup_hitters/{team_id}')
-                    if response.status_code == 200:
-                        logger.info(f"Successfully preloaded team {team_id}")
-                    else:
-                        logger.warning(f"Failed to preload team {team_id}: {response.status_code}")
-                
-                # Add delay between requests to prevent overwhelming the system
-                if i < len(POPULAR_TEAMS) - 1:  # Don't delay after the last team
-                    time.sleep(2)  # 2 second delay between teams
-            else:
-                logger.info(f"Team {team_id} already cached")
-                
-        except Exception as e:
-            logger.error(f"Error preloading team {team_id}: {e}")
-            # Continue with next team instead of crashing
-            continue
+    try:
+        precompute_slate_matchups()
+    except Exception as e:
+        logger.error(f"Error refreshing slate matchups: {e}")
     
-    logger.info("Completed background preload of popular teams")
+    logger.info("Completed background matchup refresh")
 
 def load_today_data_on_startup():
     """Load today's data from database on application startup"""
@@ -1082,6 +2248,17 @@ def load_today_data_on_startup():
         DAILY_DATA_CACHE['schedule'] = schedule_data
         logger.info("Loaded schedule data from database")
     
+    # Load precomputed matchup data
+    matchups = load_team_matchups(today_str)
+    for team_id, matchup in matchups.items():
+        cache_data(TEAM_MATCHUP_CACHE, f"matchup_{team_id}_{CURRENT_SEASON}", matchup, timeout=3600)
+    if matchups:
+        logger.info(f"Loaded matchup data for {len(matchups)} teams from database")
+    
+    for data_type, data in (('pitchers', pitcher_data), ('hitters', hitter_data), ('schedule', schedule_data)):
+        if data:
+            DAILY_DATA_VERSIONS[f"{data_type}_{today_str}"] = time.time()
+    
     if pitcher_data or hitter_data or schedule_data:
         DAILY_DATA_CACHE['update_date'] = today_str
         DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
@@ -1089,6 +2266,25 @@ def load_today_data_on_startup():
     else:
         logger.info("No cached data found for today, will fetch on first request")
 
+def with_job_lease(name, ttl):
+    """
+    Decorator so only one worker on the node runs a scheduled job.
+    
+    Every worker runs its own scheduler; the first to take the lease runs
+    the job and the rest skip it. The lease is held until it expires rather
+    than released, so a worker whose trigger fires a little later doesn't
+    run the job again. ttl should be shorter than the job's interval.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if SHARED_CACHE and not SHARED_CACHE.acquire_lease(name, ttl):
+                logger.info(f"Skipping {name}: another worker holds the job lease")
+                return None
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
 def setup_scheduler():
     """Set up the background scheduler for daily updates and preloading"""
     global scheduler
@@ -1103,7 +2299,7 @@ def setup_scheduler():
         
         # Schedule daily data update at 3 AM Eastern
         scheduler.add_job(
-            func=daily_data_update,
+            func=with_job_lease('daily_update', 12 * 3600)(daily_data_update),
             trigger="cron",
             hour=3,
             minute=0,
@@ -1112,11 +2308,11 @@ def setup_scheduler():
             replace_existing=True
         )
         
-        # Schedule popular teams preloading at 3:30 AM Eastern (after daily update)
+        # Refresh precomputed slate matchups hourly from 3:30 AM Eastern (after daily update)
         scheduler.add_job(
-            func=preload_popular_teams,
+            func=with_job_lease('preload_teams', 50 * 60)(preload_popular_teams),
             trigger="cron", 
-            hour=3,
+            hour='3-23',
             minute=30,
             timezone=pytz.timezone('US/Eastern'),
             id='preload_teams',
@@ -1125,7 +2321,7 @@ def setup_scheduler():
         
         # Schedule cleanup at 2 AM Eastern (before daily update)
         scheduler.add_job(
-            func=cleanup_old_data,
+            func=with_job_lease('cleanup', 12 * 3600)(cleanup_old_data),
             trigger="cron",
             hour=2,
             minute=0,
@@ -1134,9 +2330,21 @@ def setup_scheduler():
             replace_existing=True
         )
         
+        # Schedule player index refresh at 2:30 AM Eastern (before daily update)
+        # Not leased: each worker refreshes its own in-memory index
+        scheduler.add_job(
+            func=refresh_player_index,
+            trigger="cron",
+            hour=2,
+            minute=30,
+            timezone=pytz.timezone('US/Eastern'),
+            id='player_index_refresh',
+            replace_existing=True
+        )
+        
         # Schedule daily pitcher report at 11 AM Eastern
         scheduler.add_job(
-            func=scheduled_pitcher_report_generation,
+            func=with_job_lease('daily_pitcher_report', 12 * 3600)(scheduled_pitcher_report_generation),
             trigger="cron",
             hour=11,
             minute=0,
@@ -1150,47 +2358,36 @@ def setup_scheduler():
             logger.info("Background scheduler started successfully")
             logger.info("Scheduled jobs:")
             logger.info("- Data cleanup: 2:00 AM ET")
+            logger.info("- Player index refresh: 2:30 AM ET")
             logger.info("- Daily data update: 3:00 AM ET")
-            logger.info("- Popular teams preload: 3:30 AM ET") 
+            logger.info("- Slate matchups refresh: hourly at :30 from 3:30 AM ET")
             logger.info("- Daily pitcher report: 11:00 AM ET")
         except Exception as e:
             logger.error(f"Failed to start scheduler: {e}")
     else:
         logger.info("Scheduler already running")
 
-# Initialize database on import with recovery capability
-init_database()
-load_today_data_on_startup()
-# Scheduler will be initialized after all functions are defined
-
 # Cache data with timeout for automatic expiration
-def cache_data(cache_dict, key, data, timeout=CACHE_TIMEOUT):
+def cache_data(cache, key, data, timeout=None):
+    """Store data in a TTLCache; timeout defaults to the cache's namespace TTL"""
     if not ENABLE_CACHE:
         return data
-    
-    cache_dict[key] = {
-        'data': data,
-        'timestamp': time.time(),
-        'expires': time.time() + timeout
-    }
-    return data
+    return cache.set(key, data, timeout)
 
 # Get data from cache if available and not expired
-def get_cached_data(cache_dict, key):
+def get_cached_data(cache, key):
     if not ENABLE_CACHE:
         return None
-        
-    if key in cache_dict:
-        entry = cache_dict[key]
-        if entry['expires'] > time.time():
-            print(f"Cache hit for {key}")
-            return entry['data']
-        else:
-            # Expired entry, remove it
-            print(f"Cache expired for {key}")
-            del cache_dict[key]
-    return None
-    
+    return cache.get(key)
+
+# Initialize database on import with recovery capability
+init_database()
+load_today_data_on_startup()
+if not load_player_index():
+    # First run: build the index in the background so startup isn't blocked
+    threading.Thread(target=refresh_player_index, daemon=True).start()
+# Scheduler will be initialized after all functions are defined
+
 def get_player_stats(player_id, group="pitching", type="season"):
     """
     Gets player stats from cache or API with caching for better performance.
@@ -1236,6 +2433,67 @@ def get_player_stats(player_id, group="pitching", type="season"):
     # Store in cache and return
     return cache_data(PLAYER_STATS_CACHE, cache_key, parsed_stats)
 
+STATS_BATCH_SIZE = 50  # Player IDs per multi-person stats request
+
+def get_players_stats_batch(player_ids, group="hitting", types=("season",)):
+    """
+    Fetch stats for many players at once and fill PLAYER_STATS_CACHE.
+    
+    Uses the multi-person people endpoint, so a list of players costs one
+    request per STATS_BATCH_SIZE IDs instead of one request per player and
+    stat type. Players already cached for every requested type are skipped.
+    
+    Args:
+        player_ids: Iterable of player IDs
+        group: The stats group (pitching/hitting)
+        types: The stat types to fetch (season/seasonAdvanced)
+    
+    Returns:
+        Dictionary of player_id -> {stat_type: parsed stats}
+    """
+    results = {}
+    missing_ids = []
+    for player_id in dict.fromkeys(player_ids):
+        if not player_id:
+            continue
+        cached = {stat_type: get_cached_data(PLAYER_STATS_CACHE, f"{player_id}_{group}_{stat_type}") for stat_type in types}
+        if all(stats is not None for stats in cached.values()):
+            results[player_id] = cached
+        else:
+            missing_ids.append(player_id)
+    
+    if not missing_ids:
+        return results
+    
+    chunks = [missing_ids[i:i + STATS_BATCH_SIZE] for i in range(0, len(missing_ids), STATS_BATCH_SIZE)]
+    hydrate = f"stats(group=[{group}],type=[{','.join(types)}],sportId=1)"
+    
+    def fetch_chunk(chunk):
+        return statsapi.get('people', {'personIds': ','.join(str(player_id) for player_id in chunk), 'hydrate': hydrate})
+    
+    logger.info(f"Batch fetching {group} stats ({', '.join(types)}) for {len(missing_ids)} players in {len(chunks)} requests")
+    for chunk, (people_data, error) in zip(chunks, run_concurrently(fetch_chunk, chunks)):
+        if error is not None:
+            # Leave these players uncached so get_player_stats can still fetch them one by one
+            logger.error(f"Error batch fetching stats for {len(chunk)} players: {error}")
+            continue
+        
+        people_by_id = {person.get('id'): person for person in people_data.get('people', [])}
+        for player_id in chunk:
+            # Same shape as get_player_stats: stat values as strings, no position entry
+            player_stats = {stat_type: {} for stat_type in types}
+            for stat_entry in people_by_id.get(int(player_id), {}).get('stats', []):
+                stat_type = stat_entry.get('type', {}).get('displayName')
+                splits = stat_entry.get('splits') or []
+                if stat_type in player_stats and splits and isinstance(splits[0].get('stat'), dict):
+                    player_stats[stat_type] = {key: str(value) for key, value in splits[0]['stat'].items() if key != 'position'}
+            
+            for stat_type, parsed_stats in player_stats.items():
+                cache_data(PLAYER_STATS_CACHE, f"{player_id}_{group}_{stat_type}", parsed_stats)
+            results[player_id] = player_stats
+    
+    return results
+
 def get_team_abbreviation_to_id_map():
     """
     Fetches all teams and creates a mapping from team abbreviation to team ID.
@@ -1257,6 +2515,11 @@ ID_TO_TEAM_ABBREVIATION = {v: k for k, v in TEAM_ABBREVIATION_TO_ID.items()}
 
 @lru_cache(maxsize=100)
 def get_player_name(player_id):
+    with PLAYER_INDEX_LOCK:
+        indexed_player = PLAYER_INDEX['by_id'].get(player_id)
+    if indexed_player:
+        return indexed_player['full_name']
+    
     try:
         player_info_list = statsapi.lookup_player(player_id)
         # Ensure player_info_list is a list and has content
@@ -1274,7 +2537,16 @@ def get_player_name(player_id):
         return f"Error Getting Name (ID: {player_id})"
 
 def get_team_roster(team_id, season=CURRENT_SEASON):
-    """Get team roster with caching"""
+    """
+    Get a team's active roster as structured entries, with caching.
+    
+    This is the single roster source for the hitters pipeline, the matchup
+    API and the pitcher report, so each team is fetched at most once per
+    ROSTER_CACHE_TIMEOUT.
+    
+    Returns:
+        List of dicts with person_id, name, position, status and jersey_number
+    """
     cache_key = f"roster_{team_id}_{season}"
     
     # Check cache first
@@ -1283,10 +2555,86 @@ def get_team_roster(team_id, season=CURRENT_SEASON):
         return cached_roster
     
     # Fetch from API if not in cache
-    roster_data = statsapi.roster(team_id, season=season)
+    roster_raw = statsapi.get('team_roster', {'teamId': team_id, 'season': season, 'rosterType': 'active'})
+    
+    roster = []
+    for roster_entry in roster_raw.get('roster', []):
+        person = roster_entry.get('person', {})
+        if not person.get('id'):
+            continue
+        roster.append({
+            'person_id': person['id'],
+            'name': person.get('fullName', "Unknown"),
+            'position': roster_entry.get('position', {}).get('abbreviation'),
+            'status': roster_entry.get('status', {}).get('description', "Active"),
+            'jersey_number': roster_entry.get('jerseyNumber')
+        })
+    
+    index_players({
+        'player_id': roster_entry['person_id'],
+        'full_name': roster_entry['name'],
+        'team_id': team_id,
+        'position': roster_entry['position']
+    } for roster_entry in roster)
+    
+    return cache_data(TEAM_ROSTER_CACHE, cache_key, roster, timeout=ROSTER_CACHE_TIMEOUT)
+
+def fetch_schedule_games(date_str):
+    """
+    Fetch the schedule for a date with probable pitchers hydrated.
+
+    Returns game dicts shaped like statsapi.schedule() output, plus
+    home_probable_pitcher_id / away_probable_pitcher_id so the pitcher
+    pipeline can use IDs directly instead of looking names back up.
+    """
+    schedule_raw = statsapi.get('schedule', {
+        'sportId': 1,
+        'date': date_str,
+        'hydrate': 'probablePitcher(note),linescore'
+    })
+    
+    games = []
+    for schedule_date in schedule_raw.get('dates', []):
+        for game in schedule_date.get('games', []):
+            home = game.get('teams', {}).get('home', {})
+            away = game.get('teams', {}).get('away', {})
+            home_pitcher = home.get('probablePitcher', {})
+            away_pitcher = away.get('probablePitcher', {})
+            
+            games.append({
+                'game_id': game.get('gamePk'),
+                'game_datetime': game.get('gameDate'),
+                'game_date': schedule_date.get('date'),
+                'game_type': game.get('gameType'),
+                'status': game.get('status', {}).get('detailedState'),
+                'away_name': away.get('team', {}).get('name', "???"),
+                'home_name': home.get('team', {}).get('name', "???"),
+                'away_id': away.get('team', {}).get('id'),
+                'home_id': home.get('team', {}).get('id'),
+                'doubleheader': game.get('doubleHeader'),
+                'game_num': game.get('gameNumber'),
+                'home_probable_pitcher': home_pitcher.get('fullName', ""),
+                'away_probable_pitcher': away_pitcher.get('fullName', ""),
+                'home_probable_pitcher_id': home_pitcher.get('id'),
+                'away_probable_pitcher_id': away_pitcher.get('id'),
+                'home_pitcher_note': home_pitcher.get('note', ""),
+                'away_pitcher_note': away_pitcher.get('note', ""),
+                'away_score': away.get('score', 0),
+                'home_score': home.get('score', 0),
+                'current_inning': game.get('linescore', {}).get('currentInning', ""),
+                'inning_state': game.get('linescore', {}).get('inningState', ""),
+                'venue_id': game.get('venue', {}).get('id'),
+                'venue_name': game.get('venue', {}).get('name')
+            })
     
-    # Store in cache with longer timeout (rosters don't change often)
-    return cache_data(TEAM_ROSTER_CACHE, cache_key, roster_data, timeout=3600)  # 1 hour cache
+    # Keep the player index current with today's probable starters
+    index_players({
+        'player_id': game[f'{side}_probable_pitcher_id'],
+        'full_name': game[f'{side}_probable_pitcher'],
+        'team_id': game[f'{side}_id']
+    } for game in games for side in ('home', 'away'))
+    
+    return games
 
 def get_daily_schedule(date_str=None):
     """Get schedule for a given date with caching"""
@@ -1301,7 +2649,7 @@ def get_daily_schedule(date_str=None):
         return cached_schedule
     
     # Fetch from API if not in cache
-    schedule_data = statsapi.schedule(date=date_str, sportId=1)
+    schedule_data = fetch_schedule_games(date_str)
     
     # Store in cache with a shorter timeout (schedule details can change)
     return cache_data(SCHEDULE_CACHE, cache_key, schedule_data, timeout=300)  # 5 minutes cache
@@ -1336,6 +2684,7 @@ def pitchers_page():
 def pitchers_api():
     """Optimized pitchers API using pre-fetched daily data"""
     today_str = get_mlb_today()
+    sync_daily_data('pitchers', today_str)
     
     # First, try to get data from daily cache
     if (DAILY_DATA_CACHE['pitchers'] is not None and 
@@ -1364,14 +2713,19 @@ def pitchers_api():
     # Fallback to live fetching if no cached data available
     logger.warning("No cached pitcher data found, fetching live data")
     try:
-        live_data = fetch_daily_pitchers_data(today_str)
-        # Cache the live data for future requests
-        DAILY_DATA_CACHE['pitchers'] = live_data
-        DAILY_DATA_CACHE['update_date'] = today_str
-        DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
+        def fetch_live_pitchers():
+            live_data = fetch_daily_pitchers_data(today_str)
+            # Cache the live data for future requests
+            DAILY_DATA_CACHE['pitchers'] = live_data
+            DAILY_DATA_CACHE['update_date'] = today_str
+            DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
+            
+            # Also save to database
+            save_daily_data('pitchers', today_str, live_data)
+            return live_data
         
-        # Also save to database
-        save_daily_data('pitchers', today_str, live_data)
+        # Concurrent requests before the daily data exists share one live fetch
+        live_data = single_flight(f"live_pitchers_{today_str}", fetch_live_pitchers)
         
         return jsonify({
             **live_data,
@@ -1673,6 +3027,7 @@ def upload_image():
 def hitters_api():
     """Optimized hitters API using pre-fetched daily data"""
     today_str = get_mlb_today()
+    sync_daily_data('hitters', today_str)
     
     # First, try to get data from daily cache
     if (DAILY_DATA_CACHE['hitters'] is not None and 
@@ -1701,14 +3056,19 @@ def hitters_api():
     # Fallback to live fetching if no cached data available
     logger.warning("No cached hitter data found, fetching live data")
     try:
-        live_data = fetch_daily_hitters_data()
-        # Cache the live data for future requests
-        DAILY_DATA_CACHE['hitters'] = live_data
-        DAILY_DATA_CACHE['update_date'] = today_str
-        DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
+        def fetch_live_hitters():
+            live_data = fetch_daily_hitters_data()
+            # Cache the live data for future requests
+            DAILY_DATA_CACHE['hitters'] = live_data
+            DAILY_DATA_CACHE['update_date'] = today_str
+            DAILY_DATA_CACHE['last_updated'] = get_eastern_time().isoformat()
+            
+            # Also save to database
+            save_daily_data('hitters', today_str, live_data)
+            return live_data
         
-        # Also save to database
-        save_daily_data('hitters', today_str, live_data)
+        # Concurrent requests before the daily data exists share one live fetch
+        live_data = single_flight(f"live_hitters_{today_str}", fetch_live_hitters)
         
         return jsonify({
             **live_data,
@@ -1762,9 +3122,8 @@ def parse_league_leaders_string(leaders_str):
                 if not rank or not name or not value:
                     continue
                 
-                # Look up player_id
-                player_info = statsapi.lookup_player(name)
-                player_id = player_info[0]['id'] if player_info and len(player_info) > 0 else None
+                # Look up player_id (local index first)
+                player_id = lookup_player_id(name)
                 
                 results.append({
                     'rank': rank,
@@ -1796,9 +3155,6 @@ def matchup_hitters_page(team_id):
     
     return render_template('matchup_hitters.html', team_name=team_name, team_id=team_id, season=CURRENT_SEASON)
 
-# Add team matchup cache at the top level
-TEAM_MATCHUP_CACHE = {}
-
 @app.route('/api/matchup_hitters/<int:team_id>')
 def matchup_hitters_api(team_id):
     """Optimized matchup hitters API with improved caching and performance"""
@@ -1810,6 +3166,21 @@ def matchup_hitters_api(team_id):
         logger.info(f"Serving cached matchup data for team {team_id}")
         return jsonify(cached_data)
     
+    # Precomputed by the nightly pipeline (possibly in another worker)
+    precomputed = load_team_matchups(get_mlb_today(), team_id).get(team_id)
+    if precomputed is not None:
+        logger.info(f"Serving precomputed matchup data for team {team_id}")
+        return jsonify(cache_data(TEAM_MATCHUP_CACHE, cache_key, precomputed, timeout=3600))
+    
+    # Concurrent misses for the same team share one build
+    try:
+        return jsonify(single_flight(cache_key, lambda: build_team_matchup(team_id)))
+    except Exception as e:
+        logger.error(f"Error waiting for matchup data for team ID {team_id}: {e}")
+        return jsonify({'error': f"Error fetching data: {e}", 'matchup_data': [], 'team_name': f"Team ID {team_id}"})
+
+def build_team_matchup(team_id):
+    """Build (and cache) the matchup hitters payload for a team"""
     logger.info(f"Fetching fresh matchup data for team {team_id}")
     start_time = time.time()
     
@@ -1832,57 +3203,27 @@ def matchup_hitters_api(team_id):
                 cache_data(TEAM_ROSTER_CACHE, team_info_cache_key, team_info, timeout=3600)  # 1 hour cache
             else:
                 logger.error(f"Could not find team info for team {team_id}")
-                return jsonify({'error': f"Could not find team: {team_id}", 'matchup_data': [], 'team_name': f"Team ID {team_id}"})
+                return {'error': f"Could not find team: {team_id}", 'matchup_data': [], 'team_name': f"Team ID {team_id}"}
         
         team_name = team_info.get('name', f"Team ID {team_id}")
         
-        # Get roster with improved caching
-        roster_data = get_team_roster(team_id)
-        
-        if not isinstance(roster_data, str) or "Error" in roster_data:
-            logger.error(f"Error fetching roster for team {team_id}: {roster_data}")
-            return jsonify({'error': "Could not fetch team roster", 'matchup_data': [], 'team_name': team_name})
+        # Get structured roster from the shared roster cache
+        try:
+            roster = get_team_roster(team_id)
+        except Exception as e:
+            logger.error(f"Error fetching roster for team {team_id}: {e}")
+            return {'error': "Could not fetch team roster", 'matchup_data': [], 'team_name': team_name}
         
-        # Parse roster more efficiently - extract all player names first
-        player_names = []
-        for line in roster_data.split('\n'):
-            if line.strip() and '#' in line:
-                try:
-                    parts = line.strip().split()
-                    if len(parts) >= 3:
-                        player_name = ' '.join(parts[2:])
-                        player_names.append(player_name)
-                except Exception as e:
-                    logger.warning(f"Error parsing roster line: {line}. Error: {e}")
-                    continue
+        logger.info(f"Found {len(roster)} players on roster for team {team_id}")
         
-        logger.info(f"Found {len(player_names)} players on roster for team {team_id}")
-        
-        # Batch lookup player IDs with caching
-        player_id_map = {}  # name -> id
-        for player_name in player_names:
-            # Check cache first
-            player_cache_key = f"player_lookup_{player_name.replace(' ', '_')}"
-            cached_player_id = get_cached_data(PLAYER_STATS_CACHE, player_cache_key)
-            
-            if cached_player_id is not None:
-                player_id_map[player_name] = cached_player_id
-            else:
-                try:
-                    player_lookup = statsapi.lookup_player(player_name)
-                    if player_lookup and isinstance(player_lookup, list) and player_lookup:
-                        player_id = player_lookup[0]['id']
-                        player_id_map[player_name] = player_id
-                        # Cache the lookup result for 24 hours
-                        cache_data(PLAYER_STATS_CACHE, player_cache_key, player_id, timeout=86400)
-                    else:
-                        logger.warning(f"Could not find ID for player {player_name}")
-                except Exception as e:
-                    logger.error(f"Error looking up player {player_name}: {e}")
-                    continue
+        # Roster entries already carry player IDs
+        player_id_map = {roster_entry['name']: roster_entry['person_id'] for roster_entry in roster}
         
         logger.info(f"Successfully mapped {len(player_id_map)} player IDs")
         
+        # Warm the stats cache for the whole roster in a few multi-player requests
+        get_players_stats_batch(player_id_map.values(), group="hitting", types=("season", "seasonAdvanced"))
+        
         # Fetch stats for all players with improved error handling
         player_details_list = []
         for player_name, player_id in player_id_map.items():
@@ -1947,16 +3288,16 @@ def matchup_hitters_api(team_id):
             }
         
         # Cache the result for 1 hour
-        cache_data(TEAM_MATCHUP_CACHE, cache_key, result, timeout=3600)
+        cache_data(TEAM_MATCHUP_CACHE, f"matchup_{team_id}_{CURRENT_SEASON}", result, timeout=3600)
         
         elapsed_time = time.time() - start_time
         logger.info(f"Matchup data for team {team_id} fetched in {elapsed_time:.2f} seconds")
         
-        return jsonify(result)
+        return result
 
     except Exception as e:
         logger.error(f"Error fetching matchup hitters data for team ID {team_id}: {e}")
-        return jsonify({'error': f"Error fetching data: {e}", 'matchup_data': [], 'team_name': team_name})
+        return {'error': f"Error fetching data: {e}", 'matchup_data': [], 'team_name': team_name}
 
 # Add a route for application config information
 @app.route('/api/config')
@@ -2010,10 +3351,12 @@ def daily_status():
         },
         'automated_schedule': {
             'data_cleanup': '2:00 AM Eastern Time daily',
+            'player_index_refresh': '2:30 AM Eastern Time daily',
             'data_update': '3:00 AM Eastern Time daily',
-            'teams_preload': '3:30 AM Eastern Time daily',
+            'teams_preload': 'Hourly at :30, 3:30 AM - 11:30 PM Eastern Time',
             'pitcher_report': '11:00 AM Eastern Time daily'
-        }
+        },
+        'upstream_governor': get_upstream_governor_status()
     }
     
     return jsonify(status)
@@ -2043,6 +3386,71 @@ def trigger_update():
             'mlb_date': get_mlb_today()
         })
 
+def get_http_cache_stats():
+    """
+    Stats for the requests_cache SQLite store behind the MLB Stats API session.
+    
+    Hits and misses count every upstream request (odds feed included);
+    entries and bytes describe the SQLite store itself.
+    """
+    with UPSTREAM_CALL_STATS_LOCK:
+        requests_made = UPSTREAM_CALL_STATS['requests']
+        cache_hits = UPSTREAM_CALL_STATS['cache_hits']
+    
+    stats = {
+        'namespace': 'http_responses',
+        'hits': cache_hits,
+        'misses': requests_made - cache_hits,
+        'hit_rate': round(cache_hits / requests_made, 3) if requests_made else None,
+        'entries': None,
+        'bytes': None
+    }
+    cache = getattr(HTTP_SESSION, 'cache', None)
+    if cache is not None:
+        try:
+            stats['entries'] = len(cache.responses)
+            db_path = getattr(cache.responses, 'db_path', None)
+            if db_path and os.path.exists(db_path):
+                stats['bytes'] = os.path.getsize(db_path)
+        except Exception as e:
+            logger.error(f"Error reading HTTP cache stats: {e}")
+    return stats
+
+def get_cache_stats():
+    """Stats for every cache namespace, for sizing TTLs and memory budgets"""
+    name_cache = get_player_name.cache_info()
+    name_lookups = name_cache.hits + name_cache.misses
+    
+    namespaces = [cache.stats() for cache in CACHES]
+    namespaces.append(get_http_cache_stats())
+    namespaces.append({
+        'namespace': 'player_names',
+        'hits': name_cache.hits,
+        'misses': name_cache.misses,
+        'hit_rate': round(name_cache.hits / name_lookups, 3) if name_lookups else None,
+        'entries': name_cache.currsize,
+        'max_entries': name_cache.maxsize,
+        # Every miss inserts, so anything beyond the current size was evicted
+        'evictions': max(0, name_cache.misses - name_cache.currsize)
+    })
+    
+    return {
+        'namespaces': namespaces,
+        'total_bytes': sum(stats['bytes'] for stats in namespaces[:len(CACHES)]),
+        'cache_enabled': ENABLE_CACHE,
+        'timestamp': get_eastern_time().isoformat()
+    }
+
+@app.route('/api/cache_stats')
+@require_admin
+def cache_stats_endpoint():
+    """Hit rates, sizes and entry ages for every cache"""
+    try:
+        return jsonify({'success': True, 'stats': get_cache_stats()})
+    except Exception as e:
+        logger.error(f"Error getting cache stats: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/clear_cache')
 def clear_cache_endpoint():
     # Only clear cache if authorized
@@ -2074,7 +3482,10 @@ def refresh_odds():
     """Refresh odds data by clearing cache and fetching fresh data"""
     try:
         # Clear the requests cache to force fresh data fetch
-        requests_cache.clear()
+        HTTP_SESSION.cache.clear()
+        
+        # Revalidate the odds feed on the next request
+        invalidate_odds_snapshot()
         
         # Clear any relevant caches
         PLAYER_STATS_CACHE.clear()
@@ -2091,7 +3502,7 @@ def refresh_odds():
 
 @app.route('/api/preload_teams')
 def preload_teams_endpoint():
-    """Manually trigger preloading of popular teams"""
+    """Manually trigger a matchup refresh for every team on today's slate"""
     try:
         import threading
         thread = threading.Thread(target=preload_popular_teams)
@@ -2233,29 +3644,29 @@ def get_opponent_top_hr_hitters(team_id, limit=3):
     """Get top home run hitters from opposing team"""
     try:
         # Get team roster
-        roster_data = get_team_roster(team_id)
-        if not roster_data or 'roster' not in roster_data:
+        roster = get_team_roster(team_id)
+        if not roster:
             return []
         
+        # Warm the stats cache for the whole roster in one request
+        get_players_stats_batch([player['person_id'] for player in roster], group="hitting", types=("season",))
+        
         hitters_with_hrs = []
         
-        for player in roster_data['roster']:
+        for player in roster:
             try:
-                player_id = player.get('person', {}).get('id')
-                if not player_id:
-                    continue
-                
                 # Get hitting stats
-                stats = get_player_stats(player_id, group="hitting", type="season")
-                if stats and stats.get('homeRuns', 0) > 0:
+                stats = get_player_stats(player['person_id'], group="hitting", type="season")
+                home_runs = int(stats.get('homeRuns', 0) or 0) if stats else 0
+                if home_runs > 0:
                     hitters_with_hrs.append({
-                        'name': player.get('person', {}).get('fullName', 'Unknown'),
-                        'home_runs': int(stats.get('homeRuns', 0)),
+                        'name': player['name'],
+                        'home_runs': home_runs,
                         'avg': stats.get('avg', '.000'),
                         'ops': stats.get('ops', '.000')
                     })
             except Exception as e:
-                logger.warning(f"Error getting stats for player {player.get('person', {}).get('fullName', 'Unknown')}: {e}")
+                logger.warning(f"Error getting stats for player {player['name']}: {e}")
                 continue
         
         # Return top hitters by home runs
@@ -2552,6 +3963,7 @@ def generate_dinger_tuesday_pitcher_report_content(top_pitchers, report_date):
     
     return content
 
+@background_job
 def scheduled_pitcher_report_generation():
     """Scheduled function to generate daily pitcher report at 11AM ET"""
     logger.info("=== AUTOMATED PITCHER REPORT GENERATION STARTED ===")
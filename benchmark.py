@@ -0,0 +1,268 @@
+"""
+End-to-end benchmark for the ingestion pipeline and the API hot paths.
+
+Runs against an in-process mlb_stub_server.py league by default, or against
+whatever upstream the environment configures (--upstream env), e.g. a
+replayed cassette with MLB_CASSETTE_MODE=replay. Each scenario reports wall
+time, p50/p95/p99 latency, upstream request counts and peak memory, and the
+results are written as JSON so runs can be compared against a baseline.
+
+Usage:
+    python benchmark.py --output bench_baseline.json
+    python benchmark.py --baseline bench_baseline.json --fail-threshold 20
+    MLB_CASSETTE_MODE=replay MLB_CASSETTE_NAME=opening-day python benchmark.py --upstream env
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark ingestion and API hot paths')
+    parser.add_argument('--upstream', choices=['stub', 'env'], default='stub',
+                        help='stub: start mlb_stub_server in-process; env: use MLB_API_BASE_URL / cassette settings as configured')
+    parser.add_argument('--teams', type=int, default=30, help='Stub league size')
+    parser.add_argument('--roster-size', type=int, default=26, help='Stub players per team')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Stub latency per upstream request')
+    parser.add_argument('--seed', type=int, default=42, help='Stub league seed')
+    parser.add_argument('--iterations', type=int, default=20, help='Requests per endpoint scenario')
+    parser.add_argument('--ingest-iterations', type=int, default=3, help='Runs per ingestion scenario')
+    parser.add_argument('--scenarios', default=None, help='Comma-separated subset of scenarios to run')
+    parser.add_argument('--no-tracemalloc', action='store_true', help='Skip peak memory tracking (it slows Python code down)')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the JSON results')
+    parser.add_argument('--baseline', default=None, help='Earlier results file to compare against')
+    parser.add_argument('--fail-threshold', type=float, default=None,
+                        help='Exit non-zero if any scenario p50 regresses by more than this percent against the baseline')
+    return parser.parse_args()
+
+def start_stub_server(args):
+    """Serve a generated league on a free local port and point the app at it"""
+    from http.server import ThreadingHTTPServer
+    import mlb_stub_server
+
+    mlb_stub_server.StubRequestHandler.data = mlb_stub_server.StubData(
+        teams=args.teams, roster_size=args.roster_size, seed=args.seed)
+    mlb_stub_server.StubRequestHandler.latency_ms = args.latency_ms
+    server = ThreadingHTTPServer(('127.0.0.1', 0), mlb_stub_server.StubRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    os.environ['MLB_API_BASE_URL'] = f"{base_url}/api/"
+    os.environ['ODDS_FEED_URL'] = f"{base_url}/homerun-props.json"
+    # Measure the app, not the rate governor, unless the caller set budgets
+    os.environ.setdefault('UPSTREAM_INTERACTIVE_RATE', '1000')
+    os.environ.setdefault('UPSTREAM_BACKGROUND_RATE', '1000')
+    return server
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+class Benchmark:
+    """Runs scenarios against the app module and collects their measurements"""
+
+    def __init__(self, app_module, track_memory=True):
+        self.app = app_module
+        self.client = app_module.app.test_client()
+        self.track_memory = track_memory
+        self.results = {}
+
+    def reset_caches(self):
+        """Drop every in-process, HTTP and precomputed cache so the next call runs cold"""
+        app = self.app
+        for cache in (app.PLAYER_STATS_CACHE, app.TEAM_ROSTER_CACHE, app.SCHEDULE_CACHE, app.TEAM_MATCHUP_CACHE):
+            cache.clear()
+        for key in ('pitchers', 'hitters', 'schedule', 'last_updated', 'update_date'):
+            app.DAILY_DATA_CACHE[key] = None
+        app.get_player_name.cache_clear()
+        app.invalidate_odds_snapshot()
+        if hasattr(app.HTTP_SESSION, 'cache'):
+            app.HTTP_SESSION.cache.clear()
+
+        import sqlite3
+        conn = sqlite3.connect(app.DATABASE_PATH)
+        try:
+            conn.execute("DELETE FROM daily_data")
+            conn.execute("DELETE FROM daily_matchups")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def run(self, name, func, iterations, setup=None):
+        """Time func over several iterations, calling setup (untimed) before each one"""
+        stats_before = dict(self.app.UPSTREAM_CALL_STATS)
+        timings = []
+        peak_bytes = 0
+        errors = 0
+
+        if self.track_memory:
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        for _ in range(iterations):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            try:
+                result = func()
+                if getattr(result, 'status_code', 200) >= 400:
+                    errors += 1
+            except Exception as e:
+                print(f"  {name}: {e}", file=sys.stderr)
+                errors += 1
+            timings.append(time.perf_counter() - start)
+        wall_seconds = time.perf_counter() - wall_start
+        if self.track_memory:
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+
+        stats_after = self.app.UPSTREAM_CALL_STATS
+        self.results[name] = {
+            'iterations': iterations,
+            'errors': errors,
+            'wall_seconds': round(wall_seconds, 4),
+            'mean_ms': round(sum(timings) / len(timings) * 1000, 3),
+            'p50_ms': round(percentile(timings, 50) * 1000, 3),
+            'p95_ms': round(percentile(timings, 95) * 1000, 3),
+            'p99_ms': round(percentile(timings, 99) * 1000, 3),
+            'max_ms': round(max(timings) * 1000, 3),
+            'upstream_requests': stats_after['requests'] - stats_before['requests'],
+            'upstream_cache_hits': stats_after['cache_hits'] - stats_before['cache_hits'],
+            'upstream_errors': stats_after['errors'] - stats_before['errors'],
+            'upstream_requests_per_iteration': round((stats_after['requests'] - stats_before['requests']) / iterations, 2),
+            'peak_memory_kb': round(peak_bytes / 1024, 1) if self.track_memory else None
+        }
+        result = self.results[name]
+        peak = f"{result['peak_memory_kb']:.0f}KB" if self.track_memory else 'n/a'
+        print(f"{name:<28} p50 {result['p50_ms']:>10.2f}ms  p95 {result['p95_ms']:>10.2f}ms  "
+              f"upstream {result['upstream_requests']:>5}  peak {peak:>11}")
+
+def build_scenarios(bench, args):
+    """Scenario name -> (func, iterations, setup); warm scenarios rely on the daily update before them"""
+    app = bench.app
+    client = bench.client
+    today = app.get_mlb_today()
+
+    def schedule_team_id():
+        games = app.get_daily_schedule(today) or []
+        return games[0]['home_id'] if games and isinstance(games[0], dict) else None
+
+    def ensure_article():
+        articles = app.get_articles(limit=1)
+        if articles:
+            return articles[0]['slug']
+        app.create_article('Benchmark Article', '<p>' + 'Dinger Tuesday benchmark content. ' * 200 + '</p>',
+                           summary='Benchmark fixture', tags='benchmark')
+        return app.get_articles(limit=1)[0]['slug']
+
+    state = {}
+
+    def matchup():
+        state['team_id'] = state.get('team_id') or schedule_team_id()
+        return client.get(f"/api/matchup_hitters/{state['team_id']}")
+
+    def blog_article():
+        state['slug'] = state.get('slug') or ensure_article()
+        return client.get(f"/blog/{state['slug']}")
+
+    return {
+        'fetch_daily_pitchers_data': (lambda: app.fetch_daily_pitchers_data(today), args.ingest_iterations, bench.reset_caches),
+        'fetch_daily_hitters_data': (app.fetch_daily_hitters_data, args.ingest_iterations, bench.reset_caches),
+        'matchup_hitters_cold': (matchup, args.ingest_iterations, bench.reset_caches),
+        'daily_data_update': (app.daily_data_update, args.ingest_iterations, bench.reset_caches),
+        'matchup_hitters_warm': (matchup, args.iterations, None),
+        'api_pitchers': (lambda: client.get('/api/pitchers'), args.iterations, None),
+        'api_hitters': (lambda: client.get('/api/hitters'), args.iterations, None),
+        'blog_index': (lambda: client.get('/blog'), args.iterations, None),
+        'blog_article': (blog_article, args.iterations, None)
+    }
+
+def compare_to_baseline(results, baseline_path, fail_threshold=None):
+    """Print p50 and upstream request deltas against a baseline run; returns the scenarios that regressed"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['scenarios']
+
+    regressions = []
+    print(f"\nComparison against {baseline_path}")
+    print(f"{'scenario':<28} {'p50 before':>12} {'p50 after':>12} {'change':>9} {'upstream':>15}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if not before:
+            print(f"{name:<28} {'(new)':>12}")
+            continue
+        change = (current['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0.0
+        print(f"{name:<28} {before['p50_ms']:>10.2f}ms {current['p50_ms']:>10.2f}ms {change:>+8.1f}% "
+              f"{before['upstream_requests']:>6} -> {current['upstream_requests']:<6}")
+        if fail_threshold is not None and change > fail_threshold:
+            regressions.append(name)
+    return regressions
+
+def get_git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def main():
+    args = parse_args()
+
+    # The app reads its configuration at import time, so set it up first
+    os.environ['DISABLE_SCHEDULER'] = '1'
+    work_dir = tempfile.mkdtemp(prefix='mlb_bench_')
+    os.environ.setdefault('DATABASE_PATH', os.path.join(work_dir, 'benchmark.sqlite'))
+    server = start_stub_server(args) if args.upstream == 'stub' else None
+
+    if not args.no_tracemalloc:
+        tracemalloc.start()
+
+    import app as app_module
+    bench = Benchmark(app_module, track_memory=not args.no_tracemalloc)
+
+    scenarios = build_scenarios(bench, args)
+    selected = args.scenarios.split(',') if args.scenarios else list(scenarios)
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(unknown)} (choose from {', '.join(scenarios)})")
+
+    print(f"Benchmarking against {'in-process stub' if server else 'configured upstream'} "
+          f"(database {os.environ['DATABASE_PATH']})")
+    bench.reset_caches()
+    for name in selected:
+        func, iterations, setup = scenarios[name]
+        bench.run(name, func, iterations, setup)
+
+    output = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_commit': get_git_commit(),
+            'python': platform.python_version(),
+            'upstream': args.upstream,
+            'stub': {'teams': args.teams, 'roster_size': args.roster_size, 'latency_ms': args.latency_ms, 'seed': args.seed} if server else None,
+            'tracemalloc': not args.no_tracemalloc
+        },
+        'scenarios': bench.results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if server:
+        server.shutdown()
+
+    if args.baseline:
+        regressions = compare_to_baseline(bench.results, args.baseline, args.fail_threshold)
+        if regressions:
+            sys.exit(f"p50 regressed more than {args.fail_threshold}% in: {', '.join(regressions)}")
+
+if __name__ == '__main__':
+    main()
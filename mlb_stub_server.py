@@ -0,0 +1,377 @@
+"""
+Local stand-in for the MLB Stats API and the home run odds feed.
+
+Serves synthetic but consistent data for the endpoints the app uses
+(schedule, people, person stats, team rosters, teams, seasons, sports
+players, stats leaders and the homerun-props JSON), so the daily update,
+slate precompute and matchup API can be load tested with no network.
+
+Usage:
+    python mlb_stub_server.py --teams 30 --roster-size 26 --latency-ms 80 --error-rate 0.01
+
+    MLB_API_BASE_URL=http://127.0.0.1:8099/api/ \\
+    ODDS_FEED_URL=http://127.0.0.1:8099/homerun-props.json \\
+    python app.py
+"""
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('mlb_stub_server')
+
+FIRST_NAMES = [
+    'Aaron', 'José', 'Mookie', 'Shohei', 'Juan', 'Freddie', 'Yordan', 'Corey', 'Kyle', 'Pete',
+    'Rafael', 'Bryce', 'Manny', 'Vladimir', 'Julio', 'Gunnar', 'Bobby', 'Adley', 'Yoán', 'Marcus',
+    'Matt', 'Cal', 'Spencer', 'Gerrit', 'Zack', 'Logan', 'Tarik', 'Luis', 'Ronald', 'Elly'
+]
+LAST_NAMES = [
+    'Judge', 'Ramírez', 'Betts', 'Ohtani', 'Soto', 'Freeman', 'Álvarez', 'Seager', 'Schwarber', 'Alonso',
+    'Devers', 'Harper', 'Machado', 'Guerrero Jr.', 'Rodríguez', 'Henderson', 'Witt Jr.', 'Rutschman', 'Moncada', 'Semien',
+    'Olson', 'Raleigh', 'Strider', 'Cole', 'Wheeler', 'Webb', 'Skubal', 'Castillo', 'Acuña Jr.', 'De La Cruz'
+]
+CITIES = [
+    'Arlington', 'Boston', 'Chicago', 'Denver', 'Detroit', 'Houston', 'Kansas City', 'Anaheim', 'Los Angeles', 'Miami',
+    'Milwaukee', 'Minneapolis', 'New York', 'Oakland', 'Philadelphia', 'Pittsburgh', 'San Diego', 'San Francisco', 'Seattle', 'St. Louis',
+    'Tampa Bay', 'Toronto', 'Washington', 'Atlanta', 'Baltimore', 'Cincinnati', 'Cleveland', 'Phoenix', 'Brooklyn', 'Montreal'
+]
+MASCOTS = [
+    'Rangers', 'Sox', 'Cubs', 'Rockies', 'Tigers', 'Astros', 'Royals', 'Angels', 'Dodgers', 'Marlins',
+    'Brewers', 'Twins', 'Mets', 'Athletics', 'Phillies', 'Pirates', 'Padres', 'Giants', 'Mariners', 'Cardinals',
+    'Rays', 'Blue Jays', 'Nationals', 'Braves', 'Orioles', 'Reds', 'Guardians', 'Diamondbacks', 'Robins', 'Expos'
+]
+PITCHERS_PER_ROSTER = 13  # Roster slots, from the top, that are pitchers
+ROTATION_SIZE = 5  # Starters cycled through as probable pitchers
+
+class StubData:
+    """Deterministic synthetic league generated from a seed"""
+
+    def __init__(self, teams=30, roster_size=26, games=None, season=2025, seed=42):
+        self.season = season
+        self.seed = seed
+        self.roster_size = roster_size
+        self.games_per_day = min(games or teams // 2, teams // 2)
+        self.slate_date = date.today().isoformat()  # Follows the last schedule request, so odds match the app's slate
+
+        self.teams = []
+        for i in range(teams):
+            city = CITIES[i % len(CITIES)]
+            mascot = MASCOTS[i % len(MASCOTS)] + ('' if i < len(MASCOTS) else f' {i // len(MASCOTS) + 1}')
+            self.teams.append({
+                'id': 100 + i,
+                'name': f'{city} {mascot}',
+                'teamName': mascot,
+                'locationName': city,
+                'shortName': city,
+                'abbreviation': f'S{i:02d}',
+                'teamCode': f's{i:02d}',
+                'fileCode': f's{i:02d}'
+            })
+        self.teams_by_id = {team['id']: team for team in self.teams}
+
+        self.players = {}
+        self.rosters = {}
+        for t, team in enumerate(self.teams):
+            roster = []
+            for j in range(roster_size):
+                player_id = 600000 + t * 1000 + j
+                k = t * roster_size + j
+                first = FIRST_NAMES[k % len(FIRST_NAMES)]
+                last = LAST_NAMES[(k // len(FIRST_NAMES)) % len(LAST_NAMES)]
+                if k >= len(FIRST_NAMES) * len(LAST_NAMES):
+                    last += f' {k // (len(FIRST_NAMES) * len(LAST_NAMES)) + 1}'
+                self.players[player_id] = {
+                    'id': player_id,
+                    'team_id': team['id'],
+                    'slot': j,
+                    'first': first,
+                    'last': last,
+                    'position': 'P' if j < PITCHERS_PER_ROSTER else ['C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH'][j % 9]
+                }
+                roster.append(player_id)
+            self.rosters[team['id']] = roster
+
+    def person(self, player_id, hydrate=''):
+        """A person record, with stats attached when the hydrate asks for them"""
+        player = self.players[player_id]
+        team = self.teams_by_id[player['team_id']]
+        full_name = f"{player['first']} {player['last']}"
+        record = {
+            'id': player_id,
+            'fullName': full_name,
+            'firstName': player['first'],
+            'lastName': player['last'],
+            'useName': player['first'],
+            'boxscoreName': player['last'],
+            'nameFirstLast': full_name,
+            'primaryNumber': str(player['slot'] + 1),
+            'active': True,
+            'mlbDebutDate': f"{2012 + player_id % 12}-04-0{1 + player_id % 9}",
+            'currentTeam': {'id': team['id'], 'name': team['name']},
+            'primaryPosition': {'code': '1' if player['position'] == 'P' else '9', 'abbreviation': player['position']},
+            'batSide': {'code': 'R', 'description': 'Right'},
+            'pitchHand': {'code': 'R', 'description': 'Right'}
+        }
+
+        if 'stats(' in hydrate:
+            groups = re.search(r'group=\[?([\w,]+)', hydrate)
+            types = re.search(r'type=\[?([\w,]+)', hydrate)
+            record['stats'] = [
+                {
+                    'type': {'displayName': stat_type},
+                    'group': {'displayName': group},
+                    'splits': [{'season': str(self.season), 'stat': self.stat_line(player_id, group, stat_type)}]
+                }
+                for group in (groups.group(1).split(',') if groups else ['hitting'])
+                for stat_type in (types.group(1).split(',') if types else ['season'])
+            ]
+        return record
+
+    def stat_line(self, player_id, group, stat_type):
+        """Season stats for one player; the same player always gets the same numbers"""
+        rng = random.Random(self.seed * 1000003 + player_id)
+        if group == 'pitching':
+            batters_faced = rng.randint(150, 750)
+            home_runs = rng.randint(3, 32)
+            innings = batters_faced / 4.3
+            return {
+                'gamesPlayed': rng.randint(8, 32),
+                'battersFaced': batters_faced,
+                'inningsPitched': f"{innings:.1f}",
+                'homeRuns': home_runs,
+                'strikeOuts': rng.randint(int(innings * 0.6), int(innings * 1.3)),
+                'era': f"{rng.uniform(2.2, 6.1):.2f}",
+                'whip': f"{rng.uniform(0.9, 1.6):.2f}",
+                'homeRunsPer9': f"{home_runs * 9 / innings:.2f}"
+            }
+
+        at_bats = rng.randint(120, 620)
+        home_runs = rng.randint(0, max(1, at_bats // 12))
+        avg = rng.uniform(0.190, 0.320)
+        slg = avg + home_runs * 3 / at_bats + rng.uniform(0.05, 0.12)
+        obp = avg + rng.uniform(0.05, 0.10)
+        plate_appearances = int(at_bats * 1.1)
+        line = {
+            'gamesPlayed': rng.randint(40, 160),
+            'atBats': at_bats,
+            'plateAppearances': plate_appearances,
+            'homeRuns': home_runs,
+            'hits': int(at_bats * avg),
+            'avg': f"{avg:.3f}".lstrip('0'),
+            'obp': f"{obp:.3f}".lstrip('0'),
+            'slg': f"{slg:.3f}".lstrip('0'),
+            'ops': f"{obp + slg:.3f}".lstrip('0')
+        }
+        if stat_type == 'seasonAdvanced':
+            line.update({
+                'iso': f"{slg - avg:.3f}".lstrip('0'),
+                'babip': f"{rng.uniform(0.250, 0.350):.3f}".lstrip('0'),
+                'homeRunsPerPlateAppearance': f"{home_runs / plate_appearances:.3f}".lstrip('0')
+            })
+        return line
+
+    def schedule(self, date_str):
+        """Games for a date: teams are paired off in an order that shifts day to day"""
+        try:
+            day = date.fromisoformat(date_str).toordinal()
+            self.slate_date = date_str
+        except (TypeError, ValueError):
+            date_str = date.today().isoformat()
+            day = date.today().toordinal()
+        order = list(self.teams_by_id)
+        random.Random(self.seed + day).shuffle(order)
+
+        games = []
+        for g in range(self.games_per_day):
+            home_id, away_id = order[2 * g], order[2 * g + 1]
+            games.append({
+                'gamePk': 700000 + (day % 1000) * 100 + g,
+                'gameDate': f"{date_str}T{17 + g % 6}:05:00Z",
+                'gameType': 'R',
+                'status': {'abstractGameState': 'Preview', 'detailedState': 'Scheduled'},
+                'doubleHeader': 'N',
+                'gameNumber': 1,
+                'venue': {'id': 3000 + home_id, 'name': f"{self.teams_by_id[home_id]['locationName']} Park"},
+                'teams': {
+                    side: {
+                        'team': {'id': team_id, 'name': self.teams_by_id[team_id]['name']},
+                        'probablePitcher': self.probable_pitcher(team_id, day)
+                    }
+                    for side, team_id in (('home', home_id), ('away', away_id))
+                }
+            })
+        return {'totalGames': len(games), 'dates': [{'date': date_str, 'games': games}] if games else []}
+
+    def probable_pitcher(self, team_id, day):
+        player_id = self.rosters[team_id][day % ROTATION_SIZE]
+        return {'id': player_id, 'fullName': self.person(player_id)['fullName'], 'note': ''}
+
+    def leaders(self, category, group, limit):
+        """Stat leaders for one category, ranked across every rostered player"""
+        candidates = [
+            player_id for player_id, player in self.players.items()
+            if (player['position'] == 'P') == (group == 'pitching')
+        ]
+        ranked = sorted(candidates, key=lambda player_id: -int(self.stat_line(player_id, group, 'season').get(category, 0)))
+        leaders = []
+        for rank, player_id in enumerate(ranked[:limit], start=1):
+            team = self.teams_by_id[self.players[player_id]['team_id']]
+            leaders.append({
+                'rank': rank,
+                'value': str(self.stat_line(player_id, group, 'season').get(category, 0)),
+                'team': {'id': team['id'], 'name': team['name']},
+                'person': {'id': player_id, 'fullName': self.person(player_id)['fullName']}
+            })
+        return {'leagueLeaders': [{'leaderCategory': category, 'leaders': leaders}]}
+
+    def odds(self):
+        """Home run props for every hitter on the current slate, in the homerun-props.json shape"""
+        games = []
+        for game in self.schedule(self.slate_date)['dates'][0]['games'] if self.games_per_day else []:
+            home, away = game['teams']['home']['team'], game['teams']['away']['team']
+            players = []
+            for team in (home, away):
+                for player_id in self.rosters[team['id']][PITCHERS_PER_ROSTER:]:
+                    rng = random.Random(self.seed + player_id)
+                    players.append({
+                        'player_name': self.person(player_id)['fullName'],
+                        'line': 0.5,
+                        'over_odds': {'consensus': rng.choice([180, 240, 310, 420, 550, 700])},
+                        'sportsbook_count': rng.randint(1, 8)
+                    })
+            games.append({'away_team': away['name'], 'home_team': home['name'], 'players': players})
+        return {'generated_at': self.slate_date, 'games': games}
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    data = None
+    latency_ms = 0
+    error_rate = 0.0
+    stats = {'requests': 0, 'errors': 0}
+    stats_lock = threading.Lock()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        with self.stats_lock:
+            self.stats['requests'] += 1
+
+        if self.latency_ms:
+            time.sleep(random.uniform(0.5, 1.5) * self.latency_ms / 1000)
+
+        if self.error_rate and random.random() < self.error_rate:
+            with self.stats_lock:
+                self.stats['errors'] += 1
+            return self.send_json(503, {'message': 'Injected upstream error'})
+
+        try:
+            body = self.route(parsed.path, params)
+        except (KeyError, ValueError) as e:
+            return self.send_json(404, {'message': f'Not found: {e}'})
+
+        if body is None:
+            return self.send_json(404, {'message': f'Unknown endpoint {parsed.path}'})
+        self.send_json(200, body)
+
+    def route(self, path, params):
+        data = self.data
+        if path.endswith('homerun-props.json'):
+            return data.odds()
+        if path == '/stub/stats':
+            return dict(self.stats)
+
+        match = re.match(r'^/api/v\d+(?:\.\d+)?/(.*?)/?$', path)
+        if not match:
+            return None
+        resource = match.group(1)
+        hydrate = params.get('hydrate', '')
+
+        if resource == 'schedule':
+            return data.schedule(params.get('date'))
+        if resource == 'teams':
+            return {'teams': data.teams}
+        if resource == 'people':
+            return {'people': [data.person(int(player_id), hydrate) for player_id in params['personIds'].split(',')]}
+        if resource == 'stats/leaders':
+            limit = int(params.get('limit', 10))
+            return data.leaders(params.get('leaderCategories', 'homeRuns'), params.get('statGroup', 'hitting'), limit)
+
+        match = re.match(r'^people/(\d+)$', resource)
+        if match:
+            return {'people': [data.person(int(match.group(1)), hydrate)]}
+        match = re.match(r'^teams/(\d+)/roster$', resource)
+        if match:
+            return {'roster': [
+                {
+                    'person': {'id': player_id, 'fullName': data.person(player_id)['fullName']},
+                    'jerseyNumber': str(data.players[player_id]['slot'] + 1),
+                    'position': {'abbreviation': data.players[player_id]['position']},
+                    'status': {'code': 'A', 'description': 'Active'}
+                }
+                for player_id in data.rosters[int(match.group(1))]
+            ]}
+        match = re.match(r'^teams/(\d+)$', resource)
+        if match:
+            return {'teams': [data.teams_by_id[int(match.group(1))]]}
+        if re.match(r'^sports/\d+/players$', resource):
+            return {'people': [data.person(player_id) for player_id in data.players]}
+        if re.match(r'^seasons(/(\d+|all))?$', resource):
+            return {'seasons': [{'seasonId': str(data.season)}]}
+        return None
+
+    def send_json(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the MLB Stats API and home run odds feed')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--teams', type=int, default=30, help='Number of teams in the league')
+    parser.add_argument('--roster-size', type=int, default=26, help='Active players per team')
+    parser.add_argument('--games', type=int, default=None, help='Games per day (default: every team plays)')
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Mean added latency per request')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with a 503')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the generated league')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    if args.roster_size > 999:
+        parser.error('--roster-size must be below 1000')
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    StubRequestHandler.data = StubData(args.teams, args.roster_size, args.games, args.season, args.seed)
+    StubRequestHandler.latency_ms = args.latency_ms
+    StubRequestHandler.error_rate = args.error_rate
+
+    server = ThreadingHTTPServer((args.host, args.port), StubRequestHandler)
+    server.daemon_threads = True
+    base_url = f"http://{args.host}:{args.port}"
+    logger.info(f"Stub MLB API serving {args.teams} teams x {args.roster_size} players on {base_url}")
+    logger.info(f"MLB_API_BASE_URL={base_url}/api/ ODDS_FEED_URL={base_url}/homerun-props.json")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f"Shutting down after {StubRequestHandler.stats['requests']} requests")
+        server.server_close()
+
+if __name__ == '__main__':
+    main()